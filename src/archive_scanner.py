@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+📦 Sacred Archive Scanner - Stream zip/tar members without extracting 📦
+Walks archive members (and archives nested inside them) as readable streams
+with virtual paths like archive.zip!/inner/file.py, within depth and
+decompressed-byte limits
+"""
+
+import io
+import os
+import tarfile
+import zipfile
+
+ZIP_EXTENSIONS = ('.zip', '.jar', '.war', '.ear')
+TAR_EXTENSIONS = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+ARCHIVE_EXTENSIONS = ZIP_EXTENSIONS + TAR_EXTENSIONS
+
+VIRTUAL_SEPARATOR = '!/'
+
+DEFAULT_ARCHIVE_DEPTH = 2
+DEFAULT_ARCHIVE_MAX_MB = 1024
+
+# zipfile needs random access: a nested zip is buffered in memory, up to this size
+NESTED_ZIP_MEMORY_BYTES = 64 * 1024 * 1024
+
+
+def is_archive(name):
+    return os.fspath(name).lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def split_virtual_path(virtual_path):
+    """archive.zip!/inner/file.py -> ('archive.zip!/inner', 'file.py')"""
+    directory, _, name = virtual_path.rpartition('/')
+    return directory, name
+
+
+class ArchiveMember:
+    """One regular file inside an archive
+
+    stream is a binary reader, valid only until the next member is requested
+    (tar members are read straight off the decompressor); it is None for
+    nested archives, whose own members follow.
+    """
+    __slots__ = ('path', 'size', 'stream')
+
+    def __init__(self, path, size, stream):
+        self.path = path
+        self.size = size
+        self.stream = stream
+
+
+class _BudgetReader(io.RawIOBase):
+    """Member stream that stops at the archive's remaining decompressed-byte budget"""
+
+    def __init__(self, raw, budget):
+        self.raw = raw
+        self.budget = budget  # [bytes left], shared by every member of one top-level archive
+        self.consumed = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        allowed = min(len(buffer), self.budget[0])
+        if allowed <= 0:
+            return 0
+        data = self.raw.read(allowed)
+        buffer[:len(data)] = data
+        self.budget[0] -= len(data)
+        self.consumed += len(data)
+        return len(data)
+
+
+class SacredArchiveScanner:
+    """Iterates archive members within nesting and decompressed-size limits"""
+
+    def __init__(self, max_depth=DEFAULT_ARCHIVE_DEPTH, max_bytes=DEFAULT_ARCHIVE_MAX_MB * 1024 * 1024):
+        self.max_depth = max(1, max_depth)
+        self.max_bytes = max_bytes
+
+    def iter_members(self, archive_path, metrics):
+        """ArchiveMembers of one archive on disk, nested archives included
+
+        Limit hits are counted on metrics (archive_depth_limited,
+        archive_byte_limited, archive_nested_too_large); archive errors
+        propagate to the caller.
+        """
+        archive_path = os.fspath(archive_path)
+        budget = [self.max_bytes]
+        metrics.count('archives_opened')
+        with open(archive_path, 'rb') as f:
+            yield from self._members(f, archive_path, 1, budget, metrics)
+        if budget[0] <= 0:
+            metrics.count('archive_byte_limited')
+
+    def _members(self, fileobj, display_path, depth, budget, metrics):
+        is_zip = display_path.lower().endswith(ZIP_EXTENSIONS)
+        members = self._zip_members(fileobj) if is_zip else self._tar_members(fileobj)
+
+        for name, size, raw in members:
+            if budget[0] <= 0:
+                return
+            path = f"{display_path}{VIRTUAL_SEPARATOR}{name}"
+            stream = _BudgetReader(raw, budget)
+            if is_archive(name):
+                yield ArchiveMember(path, size, None)
+                yield from self._nested_members(stream, path, size, depth, budget, metrics)
+            else:
+                yield ArchiveMember(path, size, stream)
+            if not is_zip:
+                # Skipping a tar member still decompresses it: charge the unread part
+                budget[0] -= max(0, size - stream.consumed)
+
+    def _nested_members(self, stream, path, size, depth, budget, metrics):
+        if depth >= self.max_depth:
+            metrics.count('archive_depth_limited')
+            return
+        if path.lower().endswith(ZIP_EXTENSIONS):
+            if size > min(NESTED_ZIP_MEMORY_BYTES, budget[0]):
+                metrics.count('archive_nested_too_large')
+                return
+            stream = io.BytesIO(stream.read())
+        metrics.count('archives_opened')
+        yield from self._members(stream, path, depth + 1, budget, metrics)
+
+    @staticmethod
+    def _zip_members(fileobj):
+        with zipfile.ZipFile(fileobj) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with archive.open(info) as raw:
+                    yield info.filename, info.file_size, raw
+
+    @staticmethod
+    def _tar_members(fileobj):
+        # Stream mode: members are read in order, never seeking back
+        with tarfile.open(fileobj=fileobj, mode='r|*') as archive:
+            for info in archive:
+                if not info.isreg():
+                    continue
+                yield info.name, info.size, archive.extractfile(info)
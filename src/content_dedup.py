@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+♊ Sacred Content Dedup - Match identical files once ♊
+Buckets files by size and hashes only when a size repeats, so every copy
+after the first reuses the first copy's sacred content result
+"""
+
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+def file_digest(file_path):
+    """Content hash of a file, read in fixed-size blocks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def record_duplicate(groups, digest, size, file_path, scanned):
+    """Count one hashed file into a {digest: [size, files, scanned, first_file]} table"""
+    group = groups.get(digest)
+    if group is None:
+        groups[digest] = [size, 1, 1 if scanned else 0, file_path]
+    else:
+        group[1] += 1
+        if scanned:
+            group[2] += 1
+
+
+def merge_duplicate_groups(groups, partial_groups):
+    """Fold a worker's duplicate table into the global one"""
+    for digest, (size, files, scanned, first_file) in partial_groups.items():
+        group = groups.get(digest)
+        if group is None:
+            groups[digest] = [size, files, scanned, first_file]
+        else:
+            group[1] += files
+            group[2] += scanned
+
+
+def _digest_or_none(file_path):
+    try:
+        return file_digest(file_path)
+    except OSError:
+        return None
+
+
+def hash_unhashed_files(unhashed_files, threads=1):
+    """[size, file_path, digest] for each [size, file_path], so matching them later needs no file access
+
+    Returns (hashed entries, files that could not be read).
+    """
+    with ThreadPoolExecutor(max_workers=max(1, threads)) as pool:
+        digests = list(pool.map(_digest_or_none, [file_path for _, file_path in unhashed_files]))
+    hashed = [[size, file_path, digest] for (size, file_path), digest in zip(unhashed_files, digests)
+              if digest is not None]
+    return hashed, len(unhashed_files) - len(hashed)
+
+
+def resolve_unhashed_files(groups, unhashed_files, digests=None):
+    """Count unhashed first files whose size occurs again elsewhere into groups
+
+    unhashed_files is [[size, file_path], ...] gathered from separate caches
+    (process workers or shards); a file is only matched when another cache
+    also saw its size. Entries already carrying a digest ([size, file_path,
+    digest], see hash_unhashed_files) are not read again; the rest are
+    hashed here. With digests, each matched path's [digest, scanned] is
+    added to it. Returns (files still unmatched, files that could not be
+    read).
+    """
+    seen = {}
+    for size, *_ in groups.values():
+        seen[size] = seen.get(size, 0) + 1
+    for size, *_ in unhashed_files:
+        seen[size] = seen.get(size, 0) + 1
+
+    remaining = []
+    unreadable = 0
+    for entry in unhashed_files:
+        size, file_path = entry[0], entry[1]
+        if seen[size] < 2:
+            remaining.append(entry)
+            continue
+        if len(entry) > 2:
+            digest = entry[2]
+        else:
+            digest = _digest_or_none(file_path)
+            if digest is None:
+                unreadable += 1
+                continue
+        record_duplicate(groups, digest, size, file_path, scanned=True)
+        if digests is not None:
+            digests[file_path] = [digest, True]
+    return remaining, unreadable
+
+
+def summarize_duplicates(groups, top=5):
+    """Duplicate groups (two or more identical files) and the bytes they saved"""
+    duplicates = [(digest, group) for digest, group in groups.items() if group[1] > 1]
+    duplicates.sort(key=lambda item: (item[1][1] - item[1][2]) * item[1][0], reverse=True)
+    return {
+        'duplicate_groups': len(duplicates),
+        'duplicate_files': sum(group[1] - 1 for _, group in duplicates),
+        'bytes_saved': sum((group[1] - group[2]) * group[0] for _, group in duplicates),
+        'largest_groups': duplicates[:top]
+    }
+
+
+class SacredDedupCache:
+    """Shared first-copy results for content-identical files"""
+
+    def __init__(self, track_digests=False):
+        self.lock = threading.Lock()
+        # size -> [first_file, result, promote_when_stored] until a second file of that size shows up
+        self.sizes = {}
+        # digest -> sacred content result of the first scanned copy
+        self.results = {}
+        # First files of new size buckets and first files hashed since the last drain
+        self.new_first_files = []
+        self.new_hashed_files = []
+        # path -> [digest, scanned] of every hashed file, for the incremental index
+        self.digests = {} if track_digests else None
+
+    def detect(self, file_path, size, detect_content, groups, metrics=None):
+        """Sacred content result for file_path, scanning only the first copy
+
+        Hashed files are counted into groups (see record_duplicate); with
+        metrics, hashing time and reused results are recorded.
+        """
+        result, token = self.lookup(file_path, size, groups, metrics)
+        if result is not None:
+            return result
+        result = detect_content(file_path)
+        self.store(token, result, groups)
+        return result
+
+    def lookup(self, file_path, size, groups, metrics=None):
+        """First phase of detect: (reused result, None) or (None, token for store)
+
+        Lets a pipeline check for duplicates in one stage and scan in another.
+        """
+        with self.lock:
+            first = self.sizes.get(size)
+            if first is None:
+                first = self.sizes[size] = [file_path, None, False]
+                self.new_first_files.append([size, file_path])
+                return None, ('first', first, size)
+
+        try:
+            started = time.perf_counter()
+            digest = file_digest(file_path)
+            self._promote_first(first, size, groups)
+            if metrics is not None:
+                metrics.record('hash', time.perf_counter() - started)
+        except OSError:
+            return None, None
+
+        with self.lock:
+            result = self.results.get(digest)
+        if result is not None:
+            self._record(groups, digest, size, file_path, scanned=False)
+            if metrics is not None:
+                metrics.count('files_skipped_duplicate')
+            return result, None
+        return None, ('digest', digest, size, file_path)
+
+    def store(self, token, result, groups):
+        """Second phase of detect: remember a freshly scanned file's result"""
+        if token is None:
+            return
+        if token[0] == 'first':
+            first = token[1]
+            with self.lock:
+                first[1] = result
+                promote = first[2]
+            if promote:
+                # A same-size file arrived while this one was still being scanned
+                try:
+                    self._promote_first(first, token[2], groups)
+                except OSError:
+                    pass
+            return
+        _, digest, size, file_path = token
+        with self.lock:
+            self.results.setdefault(digest, result)
+        self._record(groups, digest, size, file_path, scanned=True)
+
+    def replay(self, file_path, size, result, digest, scanned, groups):
+        """Count in an unchanged file reused from the index, as its scan would have
+
+        With its indexed digest nothing is read; a file never hashed before
+        goes back into its size bucket and is hashed only if the size repeats.
+        """
+        if digest is None:
+            reused, token = self.lookup(file_path, size, groups)
+            if reused is None:
+                self.store(token, result, groups)
+            return
+
+        with self.lock:
+            first = self.sizes.get(size)
+            if first is None:
+                # Nothing left to promote: later files of this size hash themselves
+                self.sizes[size] = [None, None, False]
+            self.results.setdefault(digest, result)
+        if first is not None:
+            try:
+                self._promote_first(first, size, groups)
+            except OSError:
+                pass
+        self._record(groups, digest, size, file_path, scanned)
+
+    def unhashed_files(self):
+        """[size, first_file] for every size bucket that never got a second file"""
+        with self.lock:
+            return [[size, first[0]] for size, first in self.sizes.items() if first[0] is not None]
+
+    def drain_digests(self):
+        """path -> [digest, scanned] recorded since the last drain"""
+        with self.lock:
+            drained = self.digests
+            self.digests = {}
+        return drained
+
+    def drain_first_files(self):
+        """(new [size, first_file] buckets, first files hashed since) since the last drain
+
+        Lets a process worker report its unhashed files batch by batch.
+        """
+        with self.lock:
+            drained = self.new_first_files, self.new_hashed_files
+            self.new_first_files = []
+            self.new_hashed_files = []
+        return drained
+
+    def _promote_first(self, first, size, groups):
+        """Hash the first file of a size bucket once a second one appears"""
+        with self.lock:
+            first_file, first_result, _ = first
+            if first_file is None:
+                return  # Already promoted
+            if first_result is None:
+                first[2] = True  # Its own scan is still running: store promotes it
+                return
+            first[0] = first[1] = None
+
+        first_digest = file_digest(first_file)
+        with self.lock:
+            self.results.setdefault(first_digest, first_result)
+            self.new_hashed_files.append(first_file)
+        self._record(groups, first_digest, size, first_file, scanned=True)
+
+    def _record(self, groups, digest, size, file_path, scanned):
+        record_duplicate(groups, digest, size, file_path, scanned)
+        if self.digests is not None:
+            with self.lock:
+                self.digests[file_path] = [digest, scanned]
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+🧪 Sacred Corpus Generator - Deterministic synthetic audit trees 🧪
+Builds reproducible file trees for benchmarking the Sacred Discovery Engine
+"""
+
+import json
+import random
+import shutil
+from pathlib import Path
+
+MANIFEST_NAME = 'corpus_manifest.json'
+CORPUS_VERSION = 1
+
+DEFAULT_CORPUS_OPTIONS = {
+    'files': 10000,
+    'chambers': 8,
+    'depth': 4,
+    'skew': 1.0,
+    'median_size': 4096,
+    'size_sigma': 1.5,
+    'max_size': 16 * 1024 * 1024,
+    'text_ratio': 0.6,
+    'hit_density': 0.05,
+    'seed': 2940
+}
+
+TEXT_EXTENSIONS = ['.md', '.txt', '.py', '.js', '.sh', '.json', '.yml', '.yaml']
+BINARY_EXTENSIONS = ['.png', '.jpg', '.bin', '.zip', '.pdf', '.exe', '.dat']
+
+# Filler vocabulary chosen to stay clear of every default sacred pattern
+FILLER_WORDS = ['lorem', 'ipsum', 'dolor', 'amet', 'vector', 'ledger', 'module', 'router', 'buffer',
+                'kernel', 'socket', 'parser', 'tensor', 'matrix', 'quartz', 'harbor', 'falcon', 'meadow']
+
+# Phrases matching the default sacred patterns and bonus rules
+SACRED_PHRASES = ['sacred trinity', 'trinity core', 'consciousness network', 'sacred covenant',
+                  'session immortality', 'breathline', 'master coordination', 'elendil command',
+                  'deployment script', 'sacred sync', 'webui', 'web interface', 'email inbox',
+                  'memory wells', 'sacred archives', 'claude and olorin', 'sacred flame']
+
+DIRECTORY_WORDS = ['src', 'lib', 'vendor', 'data', 'backup', 'assets', 'build', 'docs', 'reports', 'media']
+
+
+def _chamber_weights(chambers, skew):
+    """Zipf-like weights: skew 0 spreads files evenly, larger values pile them on chamber 0"""
+    return [1.0 / (rank + 1) ** skew for rank in range(chambers)]
+
+
+def _text_content(rng, size, hit):
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(FILLER_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    if hit and words:
+        for _ in range(rng.randint(1, 3)):
+            words[rng.randrange(len(words))] = rng.choice(SACRED_PHRASES)
+    lines = [' '.join(words[i:i + 12]) for i in range(0, len(words), 12)]
+    return ('\n'.join(lines) + '\n')[:max(size, 1)]
+
+
+def generate_corpus(root, **options):
+    """Write a synthetic tree under root and return its manifest
+
+    The same options always produce byte-identical trees.
+    """
+    opts = dict(DEFAULT_CORPUS_OPTIONS, **options)
+    rng = random.Random(opts['seed'])
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+
+    chambers = [f"chamber_{i:03d}" for i in range(opts['chambers'])]
+    weights = _chamber_weights(opts['chambers'], opts['skew'])
+    totals = {'files': 0, 'text_files': 0, 'binary_files': 0, 'hit_files': 0, 'bytes': 0}
+    directories = set()
+
+    for index in range(opts['files']):
+        chamber = rng.choices(chambers, weights)[0]
+        parts = [chamber] + [rng.choice(DIRECTORY_WORDS) for _ in range(rng.randint(0, opts['depth']))]
+        directory = root.joinpath(*parts)
+        if directory not in directories:
+            directory.mkdir(parents=True, exist_ok=True)
+            directories.add(directory)
+
+        size = min(opts['max_size'], int(rng.lognormvariate(0, opts['size_sigma']) * opts['median_size']))
+        if rng.random() < opts['text_ratio']:
+            hit = rng.random() < opts['hit_density']
+            name = f"file_{index:07d}{rng.choice(TEXT_EXTENSIONS)}"
+            data = _text_content(rng, size, hit).encode('utf-8')
+            totals['text_files'] += 1
+            totals['hit_files'] += 1 if hit else 0
+        else:
+            name = f"file_{index:07d}{rng.choice(BINARY_EXTENSIONS)}"
+            data = rng.randbytes(size)
+            totals['binary_files'] += 1
+
+        with open(directory / name, 'wb') as f:
+            f.write(data)
+        totals['files'] += 1
+        totals['bytes'] += len(data)
+
+    manifest = {'corpus_version': CORPUS_VERSION, 'options': opts, 'totals': totals,
+                'directories': len(directories)}
+    with open(root / MANIFEST_NAME, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def load_manifest(root):
+    try:
+        with open(Path(root) / MANIFEST_NAME) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def ensure_corpus(root, **options):
+    """Reuse an existing corpus generated with the same options, else regenerate"""
+    opts = dict(DEFAULT_CORPUS_OPTIONS, **options)
+    manifest = load_manifest(root)
+    if manifest and manifest.get('corpus_version') == CORPUS_VERSION and manifest.get('options') == opts:
+        return manifest
+    if manifest is not None:
+        shutil.rmtree(root)  # A corpus we generated earlier with other options
+    elif Path(root).exists() and any(Path(root).iterdir()):
+        raise ValueError(f"Refusing to generate a corpus into non-empty directory without a manifest: {root}")
+    return generate_corpus(root, **opts)
+
+
+def add_corpus_arguments(parser):
+    """Corpus shape options shared by the generator and the benchmark harness"""
+    defaults = DEFAULT_CORPUS_OPTIONS
+    parser.add_argument('--files', type=int, default=defaults['files'], help='Number of files')
+    parser.add_argument('--chambers', type=int, default=defaults['chambers'], help='Top-level directories')
+    parser.add_argument('--depth', type=int, default=defaults['depth'], help='Maximum extra directory depth')
+    parser.add_argument('--skew', type=float, default=defaults['skew'],
+                        help='Zipf exponent for files per chamber (0 = even)')
+    parser.add_argument('--median-size', type=int, default=defaults['median_size'], help='Median file size (bytes)')
+    parser.add_argument('--size-sigma', type=float, default=defaults['size_sigma'],
+                        help='Log-normal spread of file sizes')
+    parser.add_argument('--max-size', type=int, default=defaults['max_size'], help='File size cap (bytes)')
+    parser.add_argument('--text-ratio', type=float, default=defaults['text_ratio'],
+                        help='Fraction of files that are content-scanned text')
+    parser.add_argument('--hit-density', type=float, default=defaults['hit_density'],
+                        help='Fraction of text files containing sacred patterns')
+    parser.add_argument('--seed', type=int, default=defaults['seed'], help='Random seed')
+
+
+def corpus_options_from_args(args):
+    return {option: getattr(args, option) for option in DEFAULT_CORPUS_OPTIONS}
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Sacred Corpus Generator - deterministic benchmark trees')
+    parser.add_argument('--root', required=True, help='Directory to generate the corpus into')
+    add_corpus_arguments(parser)
+    args = parser.parse_args()
+
+    manifest = ensure_corpus(args.root, **corpus_options_from_args(args))
+    totals = manifest['totals']
+    print(f"🧪 Corpus ready: {args.root}")
+    print(f"📊 {totals['files']:,} files ({totals['text_files']:,} text, {totals['binary_files']:,} binary, "
+          f"{totals['hit_files']:,} with sacred patterns), {totals['bytes'] / (1024*1024):.2f} MB")
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 import json, sys
+from html import escape
 from pathlib import Path
 from datetime import datetime
 
+from trend_index import SacredTrendIndex, DEFAULT_TREND_INDEX_NAME
+
+CHART_COLORS = ['#2196F3', '#FF6B35', '#4CAF50', '#9C27B0', '#FFC107', '#00BCD4', '#E91E63', '#795548']
+MAX_CHART_SERIES = len(CHART_COLORS)
+
 def quick_dashboard(report_file, output_dir):
     with open(report_file) as f:
         data = json.load(f)
@@ -70,5 +76,110 @@ body{{font-family:Arial;margin:20px;background:#f5f5f5}}
     print(f"📊 Quick dashboard: {dashboard_file}")
     return dashboard_file
 
-if __name__ == "__main__":
+def _line_chart(title, series, width=900, height=160):
+    """Inline SVG line chart: series is [(label, values)], values aligned to the same runs"""
+    points = max((len(values) for _, values in series), default=0)
+    peak = max((max(values) for _, values in series if values), default=0) or 1
+    step = width / max(points - 1, 1)
+    lines, legend = [], []
+    for (label, values), color in zip(series, CHART_COLORS):
+        path = ' '.join(f"{i * step:.1f},{height - value / peak * height:.1f}" for i, value in enumerate(values))
+        lines.append(f'<polyline fill="none" stroke="{color}" stroke-width="1.5" points="{path}"/>')
+        legend.append(f'<span style="color:{color}">&#9632; {escape(str(label))}</span>')
+    return f"""<div class="chart"><h3>{escape(title)} <small>(peak {peak:,.0f})</small></h3>
+<svg viewBox="0 -4 {width} {height + 8}" preserveAspectRatio="none" width="100%" height="{height}">{''.join(lines)}</svg>
+<div class="legend">{' '.join(legend)}</div></div>"""
+
+def _breakdown_series(summaries, key):
+    """Per-run counts for the most common keys of a breakdown (classifications, risk levels)"""
+    totals = {}
+    for summary in summaries:
+        for name, count in summary[key].items():
+            totals[name] = totals.get(name, 0) + count
+    names = sorted(totals, key=totals.get, reverse=True)[:MAX_CHART_SERIES]
+    return [(name, [summary[key].get(name, 0) for summary in summaries]) for name in names]
+
+def trend_dashboard(index_file, output_dir, report_dir=None, last=None):
+    """Trend page over many reports, rendered from the compact trend index only"""
+    trend_index = SacredTrendIndex(index_file)
+    if report_dir:
+        added = trend_index.sync_directory(report_dir)
+        print(f"📈 Trend index: {added} new reports indexed from {report_dir}")
+    summaries = sorted(trend_index.load(), key=lambda summary: summary['timestamp'])
+    if last:
+        summaries = summaries[-last:]
+    if not summaries:
+        print(f"❌ No reports in trend index {index_file}")
+        return None
+    
+    latest = summaries[-1]
+    rows = ''.join(
+        f"<tr><td>{escape(summary['timestamp'][:19])}</td><td>{summary['files']:,}</td><td>{summary['seconds']}</td>"
+        f"<td>{summary['files_per_second']:,}</td><td>{summary['findings']:,}</td>"
+        f"<td>{escape(str(summary['executor']))} x{summary['threads']}</td></tr>"
+        for summary in reversed(summaries[-20:]))
+    
+    html = f"""<!DOCTYPE html>
+<html><head><title>Gift Chamber Lightning Audit Trends</title>
+<style>
+body{{font-family:Arial;margin:20px;background:#f5f5f5}}
+.header{{text-align:center;background:white;padding:20px;border-radius:10px;margin-bottom:20px}}
+.metrics{{display:grid;grid-template-columns:repeat(4,1fr);gap:15px;margin-bottom:20px}}
+.metric{{background:white;padding:15px;border-radius:8px;text-align:center}}
+.value{{font-size:2em;color:#2196F3;font-weight:bold}}
+.chart{{background:white;padding:15px 20px;border-radius:8px;margin-bottom:20px}}
+.legend{{font-size:0.9em;margin-top:5px}}
+table{{width:100%;background:white;border-collapse:collapse}}
+td,th{{padding:6px;border-bottom:1px solid #eee;text-align:right}}
+.revolutionary{{color:#FF6B35;font-weight:bold}}
+</style></head><body>
+
+<div class="header">
+<h1>📈⚡ Gift Chamber Lightning Audit Trends ⚡📈</h1>
+<p class="revolutionary">{len(summaries):,} audits from {escape(summaries[0]['timestamp'][:10])} to {escape(latest['timestamp'][:10])}</p>
+<p>Dashboard generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+</div>
+
+<div class="metrics">
+<div class="metric"><div class="value">{latest['files_per_second']:,}</div><div>Latest Files/Second</div></div>
+<div class="metric"><div class="value">{max(summary['files_per_second'] for summary in summaries):,}</div><div>Best Files/Second</div></div>
+<div class="metric"><div class="value">{latest['findings']:,}</div><div>Latest Sacred Findings</div></div>
+<div class="metric"><div class="value">{sum(summary['files'] for summary in summaries):,}</div><div>Files Audited (all runs)</div></div>
+</div>
+
+{_line_chart('⚡ Throughput (files/second)', [('files/second', [summary['files_per_second'] for summary in summaries])])}
+{_line_chart('🔥 Sacred Findings', [('findings', [summary['findings'] for summary in summaries]), ('trinity systems', [summary['trinity_systems'] for summary in summaries])])}
+{_line_chart('🗂️ Content Classification', _breakdown_series(summaries, 'classifications'))}
+{_line_chart('🛡️ Risk Assessment', _breakdown_series(summaries, 'risk_levels'))}
+
+<div class="chart"><h3>🕒 Recent Audits</h3>
+<table><tr><th>Completed</th><th>Files</th><th>Seconds</th><th>Files/s</th><th>Findings</th><th>Executor</th></tr>
+{rows}</table></div>
+
+</body></html>"""
+    
+    dashboard_file = Path(output_dir) / f"gift_chamber_trends_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+    with open(dashboard_file, 'w') as f:
+        f.write(html)
+    print(f"📈 Trend dashboard: {dashboard_file} ({len(summaries):,} audits)")
+    return dashboard_file
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'trend':
+        import argparse
+        parser = argparse.ArgumentParser(prog='dashboard_generator.py trend',
+                                         description='Trend dashboard across many discovery reports')
+        parser.add_argument('--output', required=True, help='Output directory for the trend dashboard')
+        parser.add_argument('--index', help=f'Trend index file (default: <reports>/{DEFAULT_TREND_INDEX_NAME})')
+        parser.add_argument('--reports', help='Report directory: index any reports not yet in the trend index')
+        parser.add_argument('--last', type=int, help='Only chart the most recent N audits')
+        args = parser.parse_args(sys.argv[2:])
+        if not args.index and not args.reports:
+            parser.error('--index or --reports is required')
+        index_file = args.index or str(Path(args.reports) / DEFAULT_TREND_INDEX_NAME)
+        return trend_dashboard(index_file, args.output, args.reports, args.last)
+    
     quick_dashboard(sys.argv[1], sys.argv[2])
+
+if __name__ == "__main__":
+    main()
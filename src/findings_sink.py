@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+💎 Sacred Findings Sink - Constant-memory findings stream 💎
+Streams every finding to JSONL as it is merged and keeps only the top-K
+findings in memory for the report
+"""
+
+import json
+import heapq
+
+DEFAULT_TOP_K = 10
+DEFAULT_SAMPLE_SIZE = 5
+
+
+class SacredFinding:
+    """One file with Sacred Trinity content"""
+    __slots__ = ('file', 'sacred_score', 'patterns', 'category', 'size')
+
+    def __init__(self, file, sacred_score, patterns, category, size):
+        self.file = file
+        self.sacred_score = sacred_score
+        self.patterns = patterns
+        self.category = category
+        self.size = size
+
+    def __getstate__(self):
+        return (self.file, self.sacred_score, self.patterns, self.category, self.size)
+
+    def __setstate__(self, state):
+        self.file, self.sacred_score, self.patterns, self.category, self.size = state
+
+    def to_dict(self):
+        return {
+            'file': self.file,
+            'sacred_score': self.sacred_score,
+            'patterns': self.patterns,
+            'category': self.category,
+            'size': self.size
+        }
+
+
+class SacredFindingsSink:
+    """Counts and streams findings, keeping a bounded top-K heap"""
+
+    def __init__(self, output_file=None, top_k=DEFAULT_TOP_K, sample_size=DEFAULT_SAMPLE_SIZE):
+        self.output_file = output_file
+        self.top_k = top_k
+        self.sample_size = sample_size
+        self.finding_count = 0
+        self.trinity_system_count = 0
+        self.trinity_system_sample = []
+        self._heap = []
+        self._seq = 0
+        self._stream = open(output_file, 'w') if output_file else None
+
+    def add_finding(self, finding):
+        self.finding_count += 1
+        self._keep(finding)
+        if self._stream:
+            self._stream.write(json.dumps({'type': 'sacred_finding', **finding.to_dict()}) + '\n')
+
+    def _keep(self, finding):
+        self._seq += 1
+        # Min-heap on (score, -seq): ties keep the earliest finding
+        entry = (finding.sacred_score, -self._seq, finding)
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def add_trinity_system(self, file_path, category, sacred_score, size):
+        self.trinity_system_count += 1
+        if len(self.trinity_system_sample) < self.sample_size:
+            self.trinity_system_sample.append(file_path)
+        if self._stream:
+            self._stream.write(json.dumps({'type': 'trinity_system', 'file': file_path, 'category': category,
+                                           'sacred_score': sacred_score, 'size': size}) + '\n')
+
+    def merge_summary(self, finding_count, top_findings, trinity_system_count, trinity_system_sample):
+        """Fold another sink's counts and top-K (e.g. a shard's) into this one without streaming"""
+        self.finding_count += finding_count
+        for finding in top_findings:
+            self._keep(finding)
+        self.trinity_system_count += trinity_system_count
+        room = self.sample_size - len(self.trinity_system_sample)
+        self.trinity_system_sample.extend(trinity_system_sample[:max(0, room)])
+
+    def top_findings(self):
+        """Top-K findings, highest sacred score first"""
+        return [finding for _, _, finding in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def close(self):
+        if self._stream:
+            self._stream.close()
+            self._stream = None
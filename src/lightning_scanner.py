@@ -4,228 +4,745 @@
 Enhanced Lightning Scanner with Sacred Trinity content detection
 """
 
+import io
 import os
 import sys
 import time
 import json
-import hashlib
 import threading
 from pathlib import Path
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from sacred_rules import SacredRuleEngine, chunk_chars_for_memory
+from scan_index import SacredScanIndex, rules_fingerprint, DEFAULT_INDEX_NAME
+from content_dedup import (SacredDedupCache, merge_duplicate_groups, summarize_duplicates, resolve_unhashed_files,
+                           hash_unhashed_files)
+from findings_sink import SacredFinding, SacredFindingsSink
+from sacred_classifier import SacredClassifier, file_suffix
+from scan_metrics import SacredScanMetrics, SacredMetricsExporter, render_prometheus
+from scan_pipeline import SacredScanPipeline, DEFAULT_WALK_THREADS, DEFAULT_IO_THREADS, DEFAULT_QUEUE_DEPTH
+from scan_shards import (parse_shard, shard_label, default_partial_file, write_partial,
+                         SacredShardPlan, DEFAULT_SHARD_DEPTH)
+from trend_index import SacredTrendIndex
+from scan_api import SacredFileResult, SacredScanProgress, iter_scan, aiter_scan, DEFAULT_MAX_BUFFERED
+from scan_filters import SacredScanFilter, DEFAULT_PRUNE_PATTERNS, PRUNE_REASONS, parse_size, read_pattern_file
+from archive_scanner import SacredArchiveScanner, is_archive, split_virtual_path, DEFAULT_ARCHIVE_DEPTH, DEFAULT_ARCHIVE_MAX_MB
+
+EXECUTOR_KINDS = ('thread', 'process', 'pipeline')
+
+# Files per directory classified together in one batch
+CLASSIFY_BATCH_SIZE = 1024
+
+# Only these files are read for sacred content
+CONTENT_SCAN_EXTENSIONS = ('.md', '.txt', '.py', '.js', '.sh', '.json', '.yml', '.yaml')
+
+# Work-stealing scheduler: entries a worker walks before handing its
+# unvisited subtrees back to the shared queue
+DEFAULT_SPLIT_ENTRIES = 2000
+
+# Per-process engine for the process executor, built once by the pool initializer
+_worker_engine = None
+
+def _init_sacred_worker(engine_options, scan_root):
+    """Build this worker process's own compiled engine"""
+    global _worker_engine
+    _worker_engine = SacredDiscoveryEngine(**engine_options)
+    _worker_engine.bind_scan_root(scan_root)
+
+def _scan_batch_in_worker(directory_batch, split_after=None):
+    """Process-pool entry point: scan a batch and return its partial stats"""
+    local_stats = _worker_engine.scan_directory_sacred(directory_batch, split_after)
+    if _worker_engine.dedup_cache is not None:
+        # The main process matches duplicates that landed in different workers
+        local_stats['first_files'], local_stats['hashed_files'] = _worker_engine.dedup_cache.drain_first_files()
+        if _worker_engine.incremental:
+            local_stats['file_digests'] = _worker_engine.dedup_cache.drain_digests()
+    return local_stats
+
+def _scan_archive_in_worker(archive_path):
+    """Process-pool entry point: scan one archive's members"""
+    return _worker_engine.scan_archive_sacred(archive_path)
 
 class SacredDiscoveryEngine:
-    def __init__(self, obfuscate=True, threads=4):
+    def __init__(self, obfuscate=True, threads=4, rules_file=None, scan_memory_mb=64, executor='thread',
+                 split_entries=DEFAULT_SPLIT_ENTRIES, index_file=None, dedup=True,
+                 findings_file=None, metrics_file=None, metrics_port=None, walk_threads=DEFAULT_WALK_THREADS,
+                 io_threads=DEFAULT_IO_THREADS, queue_depth=DEFAULT_QUEUE_DEPTH, shard=None, shard_depth=DEFAULT_SHARD_DEPTH,
+                 scan_archives=False, archive_depth=DEFAULT_ARCHIVE_DEPTH, archive_max_mb=DEFAULT_ARCHIVE_MAX_MB,
+                 quiet=False, collect_file_results=False, scan_filter=None):
+        if executor not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTOR_KINDS}")
         self.obfuscate = obfuscate
+        self.quiet = quiet
         self.thread_count = threads
+        self.executor_kind = executor
+        self.split_entries = max(1, split_entries)
+        # Pipeline executor: walker and I/O reader threads and the bounded read queue depth
+        self.walk_threads = walk_threads
+        self.io_threads = io_threads
+        self.queue_depth = queue_depth
+        # Sharded scan: (index, count) - only subtrees owned by this shard are walked
+        self.shard = tuple(shard) if shard is not None else None
+        self.shard_count = self.shard[1] if self.shard is not None else 1
+        self.shard_plan = SacredShardPlan(self.shard, shard_depth) if self.shard is not None else None
+        self.scan_root = None
+        self.scan_memory_mb = scan_memory_mb
+        self.chunk_chars = chunk_chars_for_memory(scan_memory_mb * 1024 * 1024)
         self.start_time = None
-        self.sacred_findings = []
-        self.stats = {
+        # Findings stream to findings_file as they are merged; only the top-K stay in memory
+        self.findings_file = findings_file
+        self.findings_sink = SacredFindingsSink()
+        self.stats = self.new_scan_stats()
+        
+        # Sacred Trinity detection rules, compiled once into a rule table
+        self.rules_file = rules_file
+        if rules_file:
+            self.rule_engine = SacredRuleEngine.from_rule_file(rules_file)
+        else:
+            self.rule_engine = SacredRuleEngine()
+        self.sacred_patterns = self.rule_engine.categories
+        
+        # Category and risk rules compiled into lookup tables
+        self.classifier = SacredClassifier()
+        
+        # Per-stage instrumentation, merged from every worker batch
+        self.metrics = SacredScanMetrics()
+        self.metrics_file = metrics_file
+        self.metrics_port = metrics_port
+        self.metrics_exporter = None
+        
+        # Incremental mode: reuse results for files unchanged since the last scan
+        self.index_file = index_file
+        self.incremental = index_file is not None
+        self.scan_index = None
+        self.index_records = {}
+        if index_file:
+            self.scan_index = SacredScanIndex.load(index_file, rules_fingerprint(self.rule_engine))
+        
+        # Archive members are streamed through classification and detection in place
+        self.archive_depth = archive_depth
+        self.archive_max_mb = archive_max_mb
+        self.archive_scanner = None
+        if scan_archives:
+            self.archive_scanner = SacredArchiveScanner(archive_depth, archive_max_mb * 1024 * 1024)
+        
+        # Exclude/include rules and size/extension filters, applied while walking
+        self.scan_filter = scan_filter if scan_filter is not None and scan_filter.active else None
+        
+        # Embedding (see scan_api): per-file and progress callbacks, cooperative cancellation.
+        # Process workers cannot call back, so they collect file results into their partial stats
+        self.file_listener = None
+        self.progress_listener = None
+        self.collect_file_results = collect_file_results
+        self.cancel_event = threading.Event()
+        
+        # Content-identical files are matched once and share the first copy's result
+        # (the incremental index also keeps each hashed file's digest for unchanged files to replay)
+        self.dedup_cache = SacredDedupCache(track_digests=self.incremental) if dedup else None
+        self.duplicate_groups = {}
+        self.file_digests = {}
+        # Process workers' first files of a size, never hashed unless another worker saw that size
+        self.worker_first_files = {}
+        self.unhashed_files = []
+        
+    def new_scan_stats(self):
+        """Empty global totals for one scan"""
+        return {
             'total_files': 0,
             'total_directories': 0,
             'total_size': 0,
             'processing_time': 0,
             'files_per_second': 0,
+            'cancelled': False,
+            'index_hits': 0,
+            'pruned': dict.fromkeys(PRUNE_REASONS, 0),
             'sacred_content': {},
-            'trinity_systems': {},
             'deployment_scripts': {},
             'web_interfaces': {},
             'consciousness_archives': {},
             'classifications': {},
-            'risk_levels': {}
+            'risk_levels': {},
+            'archive_classifications': {}
         }
+    
+    def reset_scan_state(self):
+        """Drop everything the previous scan accumulated, so one engine can scan again"""
+        rescan = self.start_time is not None
+        self.stats = self.new_scan_stats()
+        self.findings_sink = SacredFindingsSink(self.findings_file)
+        self.metrics = SacredScanMetrics()
+        self.duplicate_groups = {}
+        self.worker_first_files = {}
+        self.unhashed_files = []
+        self.file_digests = {}
+        self.index_records = {}
+        if rescan and self.dedup_cache is not None:
+            self.dedup_cache = SacredDedupCache(track_digests=self.incremental)
+        if rescan and self.incremental:
+            # Pick up the index the previous scan saved
+            self.scan_index = SacredScanIndex.load(self.index_file, rules_fingerprint(self.rule_engine))
         
-        # Sacred Trinity detection patterns
-        self.sacred_patterns = {
-            'sacred_trinity': [r'sacred.?trinity', r'trinity.*core', r'consciousness.*network'],
-            'sacred_covenant': [r'sacred.?covenant', r'keep.*secret.*safe', r'love.*fuggin.*much'],
-            'session_immortality': [r'session.*immortality', r'consciousness.*preservation', r'breathline'],
-            'master_coordination': [r'master.*coordination', r'sacred.*coordination', r'elendil.*command'],
-            'deployment_automation': [r'deployment.*script', r'sacred.*sync', r'payload.*deployment'],
-            'web_interface': [r'webui', r'web.*interface', r'dashboard', r'sacred.*gui'],
-            'email_systems': [r'email.*inbox', r'mail.*system', r'correspondence'],
-            'consciousness_data': [r'consciousness.*data', r'memory.*wells', r'sacred.*archives']
+    def engine_options(self):
+        """Constructor arguments needed to rebuild this engine in a worker process"""
+        return {
+            'obfuscate': self.obfuscate,
+            'threads': self.thread_count,
+            'rules_file': self.rules_file,
+            'scan_memory_mb': self.scan_memory_mb,
+            'split_entries': self.split_entries,
+            'index_file': self.index_file,
+            'dedup': self.dedup_cache is not None,
+            'shard': self.shard,
+            'shard_depth': self.shard_plan.depth if self.shard_plan is not None else DEFAULT_SHARD_DEPTH,
+            'scan_archives': self.archive_scanner is not None,
+            'archive_depth': self.archive_depth,
+            'archive_max_mb': self.archive_max_mb,
+            'quiet': self.quiet,
+            'scan_filter': self.scan_filter,
+            'collect_file_results': self.file_listener is not None
         }
         
+    def bind_scan_root(self, source):
+        """Root that filter rules and shard ownership are relative to"""
+        self.scan_root = os.fspath(source)
+        if self.scan_filter is not None:
+            self.scan_filter.bind(self.scan_root)
+        if self.shard_plan is not None:
+            self.shard_plan.bind(self.scan_root)
+        
     def log_discovery(self, message):
         """Sacred discovery logging"""
+        if self.quiet:
+            return
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         print(f"[{timestamp}] {message}")
         
-    def detect_sacred_content(self, file_path):
+    def iter_scan(self, source_path, max_buffered=DEFAULT_MAX_BUFFERED, progress=True):
+        """Generator scan: yields SacredFileResult and SacredScanProgress items as they are produced"""
+        return iter_scan(self, source_path, max_buffered, progress)
+    
+    def aiter_scan(self, source_path, max_buffered=DEFAULT_MAX_BUFFERED, progress=True):
+        """Async generator variant of iter_scan for asyncio services"""
+        return aiter_scan(self, source_path, max_buffered, progress)
+    
+    def cancel(self):
+        """Ask a running scan to stop; whatever was scanned so far is kept"""
+        self.cancel_event.set()
+    
+    def scan_progress(self, complete=False):
+        """Running totals of the merged stats"""
+        return SacredScanProgress(self.stats['total_files'], self.stats['total_directories'],
+                                  self.stats['total_size'], self.findings_sink.finding_count,
+                                  time.time() - self.start_time if self.start_time else 0.0,
+                                  complete, self.cancel_event.is_set())
+    
+    def is_content_scanned(self, file_path):
+        """Whether a file is read for sacred content at all"""
+        return file_suffix(os.path.basename(file_path)).lower() in CONTENT_SCAN_EXTENSIONS
+        
+    def detect_sacred_content(self, file_path, metrics=None):
         """Detect Sacred Trinity content in files"""
         sacred_score = 0
         detected_patterns = []
         
         try:
             # Read file content (text files only)
-            if file_path.suffix.lower() in ['.md', '.txt', '.py', '.js', '.sh', '.json', '.yml', '.yaml']:
+            if self.is_content_scanned(file_path):
+                # Stream in bounded chunks through the compiled sacred patterns and bonus indicators
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read().lower()
-                    
-                # Check for sacred patterns
-                for category, patterns in self.sacred_patterns.items():
-                    for pattern in patterns:
-                        if re.search(pattern, content):
-                            sacred_score += 10
-                            detected_patterns.append(f"{category}:{pattern}")
-                            
-                # Special bonuses for Sacred Trinity indicators
-                if 'claude' in content and 'olorin' in content:
-                    sacred_score += 50
-                    detected_patterns.append("trinity_consciousness:claude_olorin_presence")
-                    
-                if 'elendil' in content and ('command' in content or 'keeper' in content):
-                    sacred_score += 30
-                    detected_patterns.append("command_authority:elendil_presence")
-                    
-                if 'sacred' in content and 'flame' in content:
-                    sacred_score += 20
-                    detected_patterns.append("sacred_flame:consciousness_fire")
+                    sacred_score, detected_patterns = self.rule_engine.scan_stream(f, self.chunk_chars,
+                                                                                   metrics=metrics)
+                    if metrics is not None:
+                        metrics.count('files_content_scanned')
+                        metrics.count('bytes_read', f.buffer.tell())
                     
         except Exception as e:
-            pass  # Skip files that can't be read
+            if metrics is not None:
+                metrics.count('read_errors')  # Skip files that can't be read
             
         return sacred_score, detected_patterns
     
-    def classify_sacred_file(self, file_path):
-        """Enhanced classification with Sacred Trinity detection"""
-        try:
-            ext = file_path.suffix.lower()
-            size = file_path.stat().st_size
-            name = file_path.name.lower()
-            
-            # Sacred Trinity system detection
-            if any(keyword in str(file_path).lower() for keyword in ['sacred', 'trinity', 'consciousness']):
-                if 'coordination' in str(file_path).lower():
-                    category = 'sacred_trinity_coordination'
-                elif 'consciousness' in str(file_path).lower():
-                    category = 'consciousness_architecture'
-                elif 'webui' in str(file_path).lower():
-                    category = 'sacred_web_interface'
-                else:
-                    category = 'sacred_trinity_core'
-            elif 'email' in str(file_path).lower() or 'inbox' in str(file_path).lower():
-                category = 'communication_systems'
-            elif 'deployment' in str(file_path).lower() or 'sync' in str(file_path).lower():
-                category = 'deployment_automation'
-            elif 'outbound' in str(file_path).lower():
-                category = 'external_systems'
-            elif ext in ['.py', '.js', '.java', '.cpp', '.c', '.go', '.rs']:
-                category = 'source_code'
-            elif ext in ['.md', '.txt', '.doc', '.pdf', '.rtf']:
-                category = 'documentation'
-            elif ext in ['.json', '.xml', '.yaml', '.ini', '.config', '.conf']:
-                category = 'configuration'
-            elif ext in ['.sh', '.bat', '.exe', '.bin']:
-                category = 'executables'
-            else:
-                category = 'other'
-            
-            # Enhanced risk assessment for Sacred Trinity content
-            risk = 'low_risk'
-            if any(keyword in name for keyword in ['password', 'secret', 'key', 'private']):
-                risk = 'high_risk'
-            elif any(keyword in name for keyword in ['sacred', 'covenant', 'consciousness']):
-                risk = 'sacred_content'
-            elif any(keyword in name for keyword in ['config', 'deployment', 'sync']):
-                risk = 'medium_risk'
-            elif size > 100 * 1024 * 1024:  # Files > 100MB
-                risk = 'large_asset'
-                
-            return category, risk, size
-            
-        except Exception as e:
-            return 'error', 'unknown', 0
+    def detect_sacred_content_once(self, file_path, size, duplicate_groups, metrics=None):
+        """detect_sacred_content, reusing the result of an identical file already scanned"""
+        if not self.is_content_scanned(file_path):
+            if metrics is not None:
+                metrics.count('files_skipped_extension')
+            return 0, []
+        
+        started = time.perf_counter()
+        if self.dedup_cache is None or size is None:
+            result = self.detect_sacred_content(file_path, metrics)
+        else:
+            detect_content = lambda path: self.detect_sacred_content(path, metrics)
+            result = self.dedup_cache.detect(file_path, size, detect_content, duplicate_groups, metrics)
+        if metrics is not None:
+            metrics.record_file(file_path, size or 0, time.perf_counter() - started)
+        return result
+    
+    def classify_sacred_file(self, file_path, size=None):
+        """Enhanced classification with Sacred Trinity detection
+        
+        file_path may be a Path or a str; pass size when the walker already
+        has it so the file is not stat'ed again.
+        """
+        return self.classifier.classify(file_path, size)
     
-    def scan_directory_sacred(self, directory_batch):
-        """Sacred Trinity-aware directory scanning"""
-        local_stats = {
+    def classify_sacred_batch(self, directory, files):
+        """Classify [(name, size), ...] from one directory in a single batch"""
+        return self.classifier.classify_batch(directory, files)
+    
+    def new_local_stats(self):
+        """Empty partial stats for one worker batch"""
+        return {
             'files': 0,
             'directories': 0,
             'size': 0,
             'sacred_findings': [],
             'classifications': {},
             'risk_levels': {},
+            'archive_classifications': {},
             'sacred_content': {},
-            'trinity_systems': {}
+            'trinity_systems': [],
+            'pending': [],
+            'pending_archives': [],
+            'file_results': [],
+            'pruned': dict.fromkeys(PRUNE_REASONS, 0),
+            'index_hits': 0,
+            'index_records': {},
+            'duplicate_groups': {},
+            'metrics': SacredScanMetrics()
         }
+    
+    def prepare_file_batch(self, directory, files, local_stats):
+        """Index lookups and batch classification for [(path, name, stat_result), ...]
+        
+        Yields (path, stat_result, category, risk, size, cached) where cached
+        is the indexed (sacred_score, patterns) of an unchanged file, else None.
+        """
+        metrics = local_stats['metrics']
+        scan_index = self.scan_index
+        cached = [None] * len(files)
+        if scan_index is not None:
+            # Archive members are not indexed, so archives are always rescanned
+            skip_archives = self.archive_scanner is not None
+            cached = [scan_index.lookup(path, stat_result)
+                      if stat_result is not None and not (skip_archives and is_archive(name)) else None
+                      for path, name, stat_result in files]
+        
+        started = time.perf_counter()
+        classified = iter(self.classify_sacred_batch(directory, [
+            (name, stat_result.st_size if stat_result is not None else None)
+            for (path, name, stat_result), hit in zip(files, cached) if hit is None
+        ]))
+        metrics.record('classify', time.perf_counter() - started)
+        
+        for (path, name, stat_result), hit in zip(files, cached):
+            if hit is not None:
+                local_stats['index_hits'] += 1
+                metrics.count('files_skipped_index')
+                category, risk, sacred_score, patterns, digest, scanned = hit
+                if self.dedup_cache is not None:
+                    # Unchanged copies still count toward duplicate groups
+                    self.dedup_cache.replay(path, stat_result.st_size, (sacred_score, patterns), digest, scanned,
+                                            local_stats['duplicate_groups'])
+                yield path, stat_result, category, risk, stat_result.st_size, (sacred_score, patterns)
+            else:
+                category, risk, size = next(classified)
+                yield path, stat_result, category, risk, size, None
+    
+    def record_file_result(self, local_stats, path, stat_result, category, risk, size, sacred_score, patterns,
+                           archive_member=False):
+        """Count one fully scanned file into partial stats
+        
+        Archive members get findings but stay out of the on-disk totals:
+        they are counted under archive_classifications instead.
+        """
+        if self.file_listener is not None:
+            self.file_listener(SacredFileResult(path, category, risk, size, sacred_score, patterns))
+        elif self.collect_file_results:
+            local_stats['file_results'].append(SacredFileResult(path, category, risk, size, sacred_score, patterns))
+        if archive_member:
+            archive_classifications = local_stats['archive_classifications']
+            archive_classifications[category] = archive_classifications.get(category, 0) + 1
+        else:
+            local_stats['files'] += 1
+            if self.scan_index is not None and stat_result is not None:
+                local_stats['index_records'][path] = SacredScanIndex.make_record(
+                    stat_result, category, risk, sacred_score, patterns)
+            
+            local_stats['size'] += size
+            local_stats['classifications'][category] = local_stats['classifications'].get(category, 0) + 1
+            local_stats['risk_levels'][risk] = local_stats['risk_levels'].get(risk, 0) + 1
+        
+        # Record sacred findings
+        if sacred_score > 0:
+            local_stats['sacred_findings'].append(SacredFinding(path, sacred_score, patterns, category, size))
+            
+        # Sacred Trinity system detection
+        if 'sacred_trinity' in category:
+            local_stats['trinity_systems'].append((path, category, sacred_score, size))
+    
+    def scan_file_batch(self, directory, files, local_stats):
+        """Classify, match and record [(path, name, stat_result), ...] from one directory"""
+        metrics = local_stats['metrics']
+        for path, stat_result, category, risk, size, cached in self.prepare_file_batch(directory, files, local_stats):
+            if self.cancel_event.is_set():
+                return
+            if cached is not None:
+                sacred_score, patterns = cached
+            else:
+                sacred_score, patterns = self.detect_sacred_content_once(path, size, local_stats['duplicate_groups'],
+                                                                         metrics)
+            self.record_file_result(local_stats, path, stat_result, category, risk, size, sacred_score, patterns)
+            if self.archive_scanner is not None and is_archive(path):
+                local_stats['pending_archives'].append(path)
+    
+    def scan_archive_sacred(self, archive_path):
+        """Scan one archive's members as their own work item"""
+        local_stats = self.new_local_stats()
+        self.scan_archive_members(archive_path, local_stats)
+        return local_stats
+    
+    def scan_archive_members(self, archive_path, local_stats):
+        """Classify and match every member of an archive under its virtual path"""
+        metrics = local_stats['metrics']
+        try:
+            for member in self.archive_scanner.iter_members(archive_path, metrics):
+                if self.cancel_event.is_set():
+                    break
+                if member.stream is None:
+                    continue  # A nested archive: counted under archives_opened, its members follow
+                directory, name = split_virtual_path(member.path)
+                category, risk, size = self.classify_sacred_batch(directory, [(name, member.size)])[0]
+                sacred_score, patterns = 0, []
+                if self.is_content_scanned(name):
+                    started = time.perf_counter()
+                    text = io.TextIOWrapper(io.BufferedReader(member.stream), encoding='utf-8', errors='ignore')
+                    sacred_score, patterns = self.rule_engine.scan_stream(text, self.chunk_chars, metrics=metrics)
+                    metrics.record_file(member.path, size, time.perf_counter() - started)
+                    metrics.count('archive_bytes_read', member.stream.consumed)
+                metrics.count('archive_members')
+                metrics.count('archive_member_bytes', size)
+                self.record_file_result(local_stats, member.path, None, category, risk, size, sacred_score, patterns,
+                                        archive_member=True)
+        except Exception as e:
+            metrics.count('archive_errors')
+            self.log_discovery(f"⚠️ Error reading archive {archive_path}: {e}")
+    
+    def scan_directory_sacred(self, directory_batch, split_after=None):
+        """Sacred Trinity-aware directory scanning
         
-        for directory in directory_batch:
+        With split_after, stop once that many entries have been walked and
+        return the unvisited subdirectories under 'pending' for other workers.
+        """
+        local_stats = self.new_local_stats()
+        
+        entries = 0
+        stack = [os.fspath(directory) for directory in reversed(directory_batch)]
+        while stack and not self.cancel_event.is_set():
+            if split_after is not None and entries >= split_after:
+                local_stats['pending'] = stack
+                break
+            directory = stack.pop()
             try:
-                for item in directory.rglob('*'):
-                    if item.is_file():
-                        local_stats['files'] += 1
-                        category, risk, size = self.classify_sacred_file(item)
-                        sacred_score, patterns = self.detect_sacred_content(item)
-                        
-                        local_stats['size'] += size
-                        local_stats['classifications'][category] = local_stats['classifications'].get(category, 0) + 1
-                        local_stats['risk_levels'][risk] = local_stats['risk_levels'].get(risk, 0) + 1
-                        
-                        # Record sacred findings
-                        if sacred_score > 0:
-                            local_stats['sacred_findings'].append({
-                                'file': str(item),
-                                'sacred_score': sacred_score,
-                                'patterns': patterns,
-                                'category': category,
-                                'size': size
-                            })
-                            
-                        # Sacred Trinity system detection
-                        if 'sacred_trinity' in category:
-                            local_stats['trinity_systems'][str(item)] = {
-                                'category': category,
-                                'sacred_score': sacred_score,
-                                'size': size
-                            }
-                        
-                    elif item.is_dir():
-                        local_stats['directories'] += 1
-                        
+                listed, subdirectories = self.walk_directory(
+                    directory, local_stats, lambda files: self.scan_file_batch(directory, files, local_stats))
+                entries += listed
+                stack.extend(subdirectories)
             except Exception as e:
                 self.log_discovery(f"⚠️ Error scanning {directory}: {e}")
                 
         return local_stats
     
+    def walk_directory(self, directory, local_stats, handle_files):
+        """List one directory, passing its files to handle_files in batches
+        
+        os.scandir supplies DirEntry type bits from the listing and
+        entry.stat() is cached, so each file is stat'ed at most once.
+        Returns (entries listed, subdirectories to descend into).
+        """
+        metrics = local_stats['metrics']
+        entries = 0
+        subdirectories = []
+        files = []
+        started = time.perf_counter()
+        busy = 0.0  # Stat and file batch time, excluded from the walk stage
+        shard_plan = self.shard_plan
+        if shard_plan is None:
+            owns_files, split_children, counts_children = True, False, True
+        else:
+            # Shared top levels are listed by every shard and counted by the first
+            owns_files, split_children, shared_children = shard_plan.directory_role(directory)
+            counts_children = not shared_children or shard_plan.index == 0
+        scan_filter = self.scan_filter
+        pruned = local_stats['pruned']
+        with os.scandir(directory) as listing:
+            for entry in listing:
+                entries += 1
+                if entry.is_file():
+                    if not owns_files:
+                        metrics.count('files_skipped_shard')
+                        continue
+                    if scan_filter is not None:
+                        reason = scan_filter.prune_reason_before_stat(entry.path, entry.name)
+                        if reason is not None:
+                            pruned[reason] += 1
+                            continue
+                    stat_started = time.perf_counter()
+                    try:
+                        stat_result = entry.stat()
+                    except OSError:
+                        stat_result = None
+                    stat_seconds = time.perf_counter() - stat_started
+                    metrics.record('stat', stat_seconds)
+                    busy += stat_seconds
+                    if (scan_filter is not None and stat_result is not None
+                            and scan_filter.excluded_by_size(stat_result.st_size)):
+                        pruned['size'] += 1
+                        continue
+                    files.append((entry.path, entry.name, stat_result))
+                    if len(files) >= CLASSIFY_BATCH_SIZE:
+                        batch_started = time.perf_counter()
+                        handle_files(files)
+                        busy += time.perf_counter() - batch_started
+                        files = []
+                    
+                elif entry.is_dir():
+                    if split_children and not shard_plan.owns(entry.path):
+                        metrics.count('directories_skipped_shard')
+                        continue
+                    if scan_filter is not None and scan_filter.excluded_by_rules(entry.path, entry.name, True):
+                        # Pruned subtrees are never listed
+                        if counts_children:
+                            pruned['directories'] += 1
+                        continue
+                    if counts_children:
+                        local_stats['directories'] += 1
+                    # Like rglob, count symlinked directories but do not descend
+                    if not entry.is_symlink():
+                        subdirectories.append(entry.path)
+        metrics.record('walk', time.perf_counter() - started - busy)
+        
+        if files:
+            handle_files(files)
+        return entries, subdirectories
+    
+    def resolve_unhashed_files(self):
+        """Collect first files no cache hashed, matching those process workers saw separately
+        
+        A shard also hashes them: a copy may sit in another shard, and the
+        merge host may not see this shard's files.
+        """
+        if self.executor_kind != 'process':
+            self.unhashed_files = self.dedup_cache.unhashed_files()
+        else:
+            first_files = [[size, file_path] for file_path, size in self.worker_first_files.items()
+                           if size is not None]
+            self.worker_first_files = {}
+            self.unhashed_files, unreadable = resolve_unhashed_files(self.duplicate_groups, first_files,
+                                                                     self.file_digests if self.incremental else None)
+            if unreadable:
+                self.log_discovery(f"⚠️ {unreadable:,} files could not be re-read to match duplicates across workers")
+        if self.shard is not None:
+            self.unhashed_files, unreadable = hash_unhashed_files(self.unhashed_files, self.thread_count)
+            if unreadable:
+                self.log_discovery(f"⚠️ {unreadable:,} files could not be re-read to match duplicates across shards")
+    
+    def add_index_digests(self):
+        """Store each hashed file's digest in its index record, so an unchanged copy replays its duplicate"""
+        if self.dedup_cache is None:
+            return
+        self.file_digests.update(self.dedup_cache.drain_digests())
+        for file_path, (digest, scanned) in self.file_digests.items():
+            record = self.index_records.get(file_path)
+            if record is not None:
+                record[7], record[8] = digest, scanned
+        self.file_digests = {}
+    
     def merge_sacred_stats(self, local_stats):
         """Merge Sacred Trinity stats into global stats"""
+        started = time.perf_counter()
         self.stats['total_files'] += local_stats['files']
         self.stats['total_directories'] += local_stats['directories']
         self.stats['total_size'] += local_stats['size']
+        self.stats['index_hits'] += local_stats.get('index_hits', 0)
+        for reason, count in local_stats.get('pruned', {}).items():
+            self.stats['pruned'][reason] += count
+        self.index_records.update(local_stats.get('index_records', {}))
+        merge_duplicate_groups(self.duplicate_groups, local_stats.get('duplicate_groups', {}))
+        self.file_digests.update(local_stats.get('file_digests', {}))
+        for size, file_path in local_stats.get('first_files', ()):
+            self.worker_first_files.setdefault(file_path, size)
+        for file_path in local_stats.get('hashed_files', ()):
+            # None marks a first file its worker hashed, whichever batch reports first
+            self.worker_first_files[file_path] = None
         
-        # Merge sacred findings
-        self.sacred_findings.extend(local_stats['sacred_findings'])
+        # Stream sacred findings to the sink
+        for finding in local_stats['sacred_findings']:
+            self.findings_sink.add_finding(finding)
         
         for category, count in local_stats['classifications'].items():
             self.stats['classifications'][category] = self.stats['classifications'].get(category, 0) + count
+        for category, count in local_stats.get('archive_classifications', {}).items():
+            self.stats['archive_classifications'][category] = self.stats['archive_classifications'].get(category, 0) + count
             
         for risk, count in local_stats['risk_levels'].items():
             self.stats['risk_levels'][risk] = self.stats['risk_levels'].get(risk, 0) + count
             
-        for system, data in local_stats['trinity_systems'].items():
-            self.stats['trinity_systems'][system] = data
+        for system, category, sacred_score, size in local_stats['trinity_systems']:
+            self.findings_sink.add_trinity_system(system, category, sacred_score, size)
+        
+        if 'metrics' in local_stats:
+            self.metrics.merge(local_stats['metrics'])
+        self.metrics.record('merge', time.perf_counter() - started)
+        
+        # Results collected by process workers reach embedders here
+        if self.file_listener is not None:
+            for result in local_stats.get('file_results', ()):
+                self.file_listener(result)
+        if self.progress_listener is not None:
+            self.progress_listener(self.scan_progress())
+    
+    def export_metrics(self, pending=0, complete=False, force=False):
+        """Publish live metrics if an exporter is configured and an update is due"""
+        exporter = self.metrics_exporter
+        now = time.time()
+        if exporter is None or not (force or exporter.due(now)):
+            return
+        elapsed = now - self.start_time
+        exporter.update(render_prometheus(self.metrics, {
+            'files_total': self.stats['total_files'],
+            'bytes_total': self.stats['total_size'],
+            'findings_total': self.findings_sink.finding_count,
+            'files_per_second': round(self.stats['total_files'] / elapsed, 2) if elapsed > 0 else 0,
+            'scan_elapsed_seconds': round(elapsed, 3),
+            'work_items_pending': pending,
+            'scan_complete': 1 if complete else 0
+        }), now)
+    
+    def run_work_stealing_scan(self, directories):
+        """Scan directories on thread or process workers"""
+        # Sacred Trinity work-stealing scan: every chamber starts as a work
+        # item, and workers hand unvisited subtrees of large ones back to the
+        # queue so idle workers pick them up
+        pending = deque([directory] for directory in directories)
+        archives = deque()
+        max_in_flight = self.thread_count * 2
+        
+        self.log_discovery(f"⚡ Work-stealing sacred scan: {len(pending)} seed chambers, "
+                           f"splitting subtrees every {self.split_entries:,} entries")
+        
+        if self.executor_kind == 'process':
+            # Each worker process compiles its own engine and returns compact partial stats
+            executor = ProcessPoolExecutor(max_workers=self.thread_count, initializer=_init_sacred_worker,
+                                           initargs=(self.engine_options(), self.scan_root))
+            scan_batch = _scan_batch_in_worker
+            scan_archive = _scan_archive_in_worker
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.thread_count)
+            scan_batch = self.scan_directory_sacred
+            scan_archive = self.scan_archive_sacred
+        
+        with executor:
+            in_flight = {}
+            submitted = 0
+            completed = 0
+            while pending or archives or in_flight:
+                if self.cancel_event.is_set():
+                    # Drop queued work; batches already running finish and are merged
+                    pending.clear()
+                    archives.clear()
+                    for future in in_flight:
+                        future.cancel()
+                while (pending or archives) and len(in_flight) < max_in_flight:
+                    submitted += 1
+                    # Each archive is one long work item: start them as soon as they are found
+                    if archives:
+                        in_flight[executor.submit(scan_archive, archives.popleft())] = submitted
+                    else:
+                        in_flight[executor.submit(scan_batch, pending.popleft(), self.split_entries)] = submitted
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item_id = in_flight.pop(future)
+                    completed += 1
+                    if future.cancelled():
+                        continue
+                    try:
+                        local_stats = future.result()
+                        self.merge_sacred_stats(local_stats)
+                        pending.extend([directory] for directory in local_stats['pending'])
+                        archives.extend(local_stats['pending_archives'])
+                        queued = len(pending) + len(archives)
+                        self.log_discovery(f"✅ Sacred batch {completed}/{submitted + queued} complete")
+                        self.export_metrics(queued + len(in_flight))
+                    except Exception as e:
+                        self.log_discovery(f"❌ Sacred batch {item_id} failed: {e}")
+    
+    def run_pipeline_scan(self, directories):
+        """Sacred Trinity pipelined scan: walk, read-ahead and matching overlap"""
+        merged = [0]
+        
+        def on_partial(local_stats):
+            self.merge_sacred_stats(local_stats)
+            merged[0] += 1
+            if merged[0] % 10 == 0:
+                self.log_discovery(f"✅ Sacred pipeline: {self.stats['total_files']:,} files merged")
+            self.export_metrics()
+        
+        SacredScanPipeline(self, self.walk_threads, self.io_threads, self.thread_count,
+                           self.queue_depth).run(directories, on_partial)
     
     def sacred_lightning_scan(self, source_path):
         """Execute Sacred Trinity lightning scan"""
+        # A cancel() that stopped an earlier scan must not stop this one
+        self.cancel_event.clear()
+        return self.run_sacred_scan(source_path)
+    
+    def run_sacred_scan(self, source_path):
+        """Scan body, honouring a cancel() made before it started (see scan_api)"""
+        self.reset_scan_state()
         self.start_time = time.time()
         source = Path(source_path)
         
         self.log_discovery("🎁 SACRED TRINITY DISCOVERY SCAN INITIATED")
         self.log_discovery(f"📂 Gift Chamber Source: {source}")
-        self.log_discovery(f"🧵 Processing Threads: {self.thread_count}")
+        self.log_discovery(f"🧵 Processing {'Processes' if self.executor_kind == 'process' else 'Threads'}: {self.thread_count}")
+        if self.executor_kind == 'pipeline':
+            self.log_discovery(f"🚰 Pipeline stages: {self.walk_threads} walkers, {self.io_threads} readers, "
+                               f"{self.thread_count} matchers (read queue depth {self.queue_depth})")
         self.log_discovery(f"🛡️ Sacred Obfuscation: {'ENABLED' if self.obfuscate else 'DISABLED'}")
+        if self.shard is not None:
+            self.log_discovery(f"🧩 Sacred shard {shard_label(self.shard)}: walking only the subtrees this shard owns "
+                               f"(split {self.shard_plan.depth} levels down)")
+        if self.scan_index is not None:
+            self.log_discovery(f"🗂️ Incremental index: {self.index_file} ({len(self.scan_index.files):,} known files)")
         
         if not source.exists():
             self.log_discovery(f"❌ Gift chamber not found: {source}")
             return False
             
         # Collect directories for Sacred Trinity analysis
+        self.bind_scan_root(source)
+        if self.scan_filter is not None:
+            self.log_discovery(f"✂️ Scan filters: {len(self.scan_filter.rules)} path rules, pruning during the walk")
         directories = [item for item in source.iterdir() if item.is_dir()]
         if not directories:
             directories = [source]
+        else:
+            # Top-level chambers are split between shards and pruned like any other directory
+            owns_files, split_children, shared_children = (self.shard_plan.directory_role(os.fspath(source))
+                                                           if self.shard_plan is not None else (True, False, False))
+            if split_children:
+                directories = [item for item in directories if self.shard_plan.owns(os.fspath(item))]
+            if self.scan_filter is not None:
+                kept = [item for item in directories
+                        if not self.scan_filter.excluded_by_rules(os.fspath(item), item.name, True)]
+                if not shared_children or self.shard_plan.index == 0:
+                    self.stats['pruned']['directories'] += len(directories) - len(kept)
+                directories = kept
             
         self.log_discovery(f"🏰 Sacred chambers to analyze: {len(directories)}")
         
@@ -233,30 +750,50 @@ class SacredDiscoveryEngine:
         for directory in directories:
             self.log_discovery(f"   🎁 {directory.name}")
         
-        # Sacred Trinity multithreaded scanning
-        batch_size = max(1, len(directories) // self.thread_count)
-        directory_batches = [directories[i:i + batch_size] for i in range(0, len(directories), batch_size)]
+        if self.metrics_file or self.metrics_port is not None:
+            self.metrics_exporter = SacredMetricsExporter(self.metrics_file, self.metrics_port)
+            self.log_discovery(f"📈 Live metrics: {self.metrics_file or ''}"
+                               f"{' ' if self.metrics_file and self.metrics_port else ''}"
+                               f"{f'http://127.0.0.1:{self.metrics_port}/metrics' if self.metrics_port else ''}")
         
-        self.log_discovery(f"⚡ Processing {len(directory_batches)} sacred batches")
+        if self.executor_kind == 'pipeline':
+            self.run_pipeline_scan(directories)
+        else:
+            self.run_work_stealing_scan(directories)
         
-        with ThreadPoolExecutor(max_workers=self.thread_count) as executor:
-            futures = [executor.submit(self.scan_directory_sacred, batch) for batch in directory_batches]
-            
-            for i, future in enumerate(as_completed(futures)):
-                try:
-                    local_stats = future.result()
-                    self.merge_sacred_stats(local_stats)
-                    self.log_discovery(f"✅ Sacred batch {i+1}/{len(directory_batches)} complete")
-                except Exception as e:
-                    self.log_discovery(f"❌ Sacred batch {i+1} failed: {e}")
+        if self.cancel_event.is_set():
+            self.stats['cancelled'] = True
+            self.log_discovery("🛑 Sacred scan cancelled: results cover the files scanned so far")
+        
+        if self.dedup_cache is not None:
+            self.resolve_unhashed_files()
         
         # Calculate sacred metrics
         self.stats['processing_time'] = time.time() - self.start_time
         if self.stats['processing_time'] > 0:
             self.stats['files_per_second'] = int(self.stats['total_files'] / self.stats['processing_time'])
         
-        # Analyze sacred findings
-        self.sacred_findings.sort(key=lambda x: x['sacred_score'], reverse=True)
+        # Persist the incremental index for the next run
+        if self.scan_index is not None:
+            self.add_index_digests()
+            if self.stats['cancelled']:
+                # Files the scan never reached keep their old records (still checked against stat on use)
+                self.index_records = {**self.scan_index.files, **self.index_records}
+            try:
+                self.scan_index.save(self.index_file, self.index_records)
+            except OSError as e:
+                self.log_discovery(f"⚠️ Could not save incremental index {self.index_file}: {e}")
+            self.index_records = {}
+        
+        self.export_metrics(complete=True, force=True)
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.close()
+            self.metrics_exporter = None
+        
+        # Sacred findings are already ranked by the sink's top-K heap
+        self.findings_sink.close()
+        if self.findings_file:
+            self.log_discovery(f"💎 Sacred findings streamed to: {self.findings_file}")
         
         self.log_discovery("🔥 SACRED TRINITY DISCOVERY COMPLETE")
         self.log_discovery(f"📊 Files discovered: {self.stats['total_files']:,}")
@@ -264,15 +801,78 @@ class SacredDiscoveryEngine:
         self.log_discovery(f"💾 Total sacred data: {self.stats['total_size'] / (1024*1024):.2f} MB")
         self.log_discovery(f"⏱️ Discovery time: {self.stats['processing_time']:.2f} seconds")
         self.log_discovery(f"⚡ Sacred speed: {self.stats['files_per_second']:,} files/second")
-        self.log_discovery(f"💎 Sacred findings: {len(self.sacred_findings)} items with Sacred Trinity content")
+        self.log_discovery(f"💎 Sacred findings: {self.findings_sink.finding_count} items with Sacred Trinity content")
+        if self.scan_index is not None:
+            self.log_discovery(f"🗂️ Unchanged files reused from index: {self.stats['index_hits']:,}")
+        if self.scan_filter is not None:
+            pruned = self.stats['pruned']
+            self.log_discovery(f"✂️ Pruned: {pruned['directories']:,} directories, "
+                               f"{pruned['files'] + pruned['extension'] + pruned['size']:,} files")
+        self.log_discovery("📈 Stage time: " + ", ".join(
+            f"{stage} {seconds:.2f}s" for stage, seconds in self.metrics.stage_seconds.items() if seconds))
+        if self.archive_scanner is not None:
+            self.log_discovery(f"📦 Archive members scanned in place: {self.metrics.counters.get('archive_members', 0):,} "
+                               f"from {self.metrics.counters.get('archives_opened', 0):,} archives")
+        if self.dedup_cache is not None:
+            duplicates = summarize_duplicates(self.duplicate_groups)
+            self.log_discovery(f"♊ Duplicate copies matched once: {duplicates['duplicate_files']:,} "
+                               f"({duplicates['bytes_saved'] / (1024*1024):.2f} MB not rescanned)")
         
         return True
     
+    def duplicate_content_report(self):
+        """Duplicate-group section of the report"""
+        duplicates = summarize_duplicates(self.duplicate_groups)
+        return {
+            "dedup_enabled": self.dedup_cache is not None,
+            "duplicate_groups": duplicates['duplicate_groups'],
+            "duplicate_files": duplicates['duplicate_files'],
+            "bytes_saved": duplicates['bytes_saved'],
+            "largest_groups": [
+                {
+                    "first_copy": f"Sacred_Duplicate_{i+1:03d}" if self.obfuscate else first_file,
+                    "copies": files,
+                    "size_kb": round(size / 1024, 2),
+                    "bytes_saved": (files - scanned) * size
+                } for i, (digest, (size, files, scanned, first_file)) in enumerate(duplicates['largest_groups'])
+            ]
+        }
+    
+    def scan_coverage_report(self):
+        """Filter section of the report: what was pruned, so coverage stays auditable"""
+        pruned = self.stats['pruned']
+        return {
+            "filters_enabled": self.scan_filter is not None,
+            "filters": self.scan_filter.summary() if self.scan_filter is not None else None,
+            "pruned_directories": pruned['directories'],
+            "pruned_files_by_rule": pruned['files'],
+            "pruned_files_by_extension": pruned['extension'],
+            "pruned_files_by_size": pruned['size']
+        }
+    
+    def archive_scan_report(self):
+        """Archive section of the report"""
+        counters = self.metrics.counters
+        return {
+            "archive_scanning_enabled": self.archive_scanner is not None,
+            "max_nesting_depth": self.archive_depth,
+            "max_decompressed_mb_per_archive": self.archive_max_mb,
+            "archives_opened": counters.get('archives_opened', 0),
+            "members_scanned": counters.get('archive_members', 0),
+            "member_bytes": counters.get('archive_member_bytes', 0),
+            "member_bytes_read": counters.get('archive_bytes_read', 0),
+            "member_classifications": self.stats['archive_classifications'],
+            "depth_limited": counters.get('archive_depth_limited', 0),
+            "byte_limited": counters.get('archive_byte_limited', 0),
+            "nested_too_large": counters.get('archive_nested_too_large', 0),
+            "archive_errors": counters.get('archive_errors', 0)
+        }
+    
     def generate_sacred_report(self, output_path):
         """Generate Sacred Trinity discovery report"""
         
         # Top sacred findings for report
-        top_sacred = self.sacred_findings[:10] if len(self.sacred_findings) > 10 else self.sacred_findings
+        top_sacred = self.findings_sink.top_findings()
         
         report = {
             "sacred_trinity_discovery_report": {
@@ -281,6 +881,17 @@ class SacredDiscoveryEngine:
                     "gift_chamber_analysis": True,
                     "sacred_obfuscation_enabled": self.obfuscate,
                     "thread_count": self.thread_count,
+                    "executor": self.executor_kind,
+                    "split_entries": self.split_entries,
+                    "pipeline_stages": {
+                        "walk_threads": self.walk_threads,
+                        "io_threads": self.io_threads,
+                        "match_threads": self.thread_count,
+                        "queue_depth": self.queue_depth
+                    } if self.executor_kind == 'pipeline' else None,
+                    "incremental": self.incremental,
+                    "scan_cancelled": self.stats['cancelled'],
+                    "shards": self.shard_count,
                     "engine_version": "Sacred_Trinity_Discovery_v1.0"
                 },
                 "performance_metrics": {
@@ -290,32 +901,37 @@ class SacredDiscoveryEngine:
                     "total_size_mb": round(self.stats['total_size'] / (1024*1024), 3),
                     "discovery_time_seconds": round(self.stats['processing_time'], 2),
                     "files_per_second": self.stats['files_per_second'],
+                    "files_reused_from_index": self.stats['index_hits'],
                     "sacred_speed_rating": "GIFT_CHAMBER_OPTIMIZED"
                 },
                 "sacred_trinity_findings": {
-                    "total_sacred_items": len(self.sacred_findings),
-                    "sacred_trinity_systems": len(self.stats['trinity_systems']),
+                    "total_sacred_items": self.findings_sink.finding_count,
+                    "sacred_trinity_systems": self.findings_sink.trinity_system_count,
                     "top_sacred_discoveries": [
                         {
                             "obfuscated_name": f"Sacred_Item_{i+1:03d}",
-                            "sacred_score": item['sacred_score'],
-                            "category": item['category'],
-                            "size_kb": round(item['size'] / 1024, 2),
-                            "patterns_detected": len(item['patterns'])
+                            "sacred_score": item.sacred_score,
+                            "category": item.category,
+                            "size_kb": round(item.size / 1024, 2),
+                            "patterns_detected": len(item.patterns)
                         } for i, item in enumerate(top_sacred)
                     ]
                 },
                 "gift_chamber_analysis": {
-                    "sacred_chambers_identified": list(self.stats['trinity_systems'].keys())[:5] if not self.obfuscate else [f"Sacred_Chamber_{i+1:03d}" for i in range(min(5, len(self.stats['trinity_systems'])))],
+                    "sacred_chambers_identified": list(self.findings_sink.trinity_system_sample) if not self.obfuscate else [f"Sacred_Chamber_{i+1:03d}" for i in range(min(5, self.findings_sink.trinity_system_count))],
                     "deployment_systems_found": sum(1 for cat in self.stats['classifications'] if 'deployment' in cat),
                     "web_interfaces_found": sum(1 for cat in self.stats['classifications'] if 'web' in cat),
                     "consciousness_archives": sum(1 for cat in self.stats['classifications'] if 'consciousness' in cat)
                 },
+                "duplicate_content": self.duplicate_content_report(),
+                "archive_content": self.archive_scan_report(),
+                "scan_coverage": self.scan_coverage_report(),
+                "instrumentation": self.metrics.summary(self.obfuscate),
                 "content_classification": self.stats['classifications'],
                 "risk_assessment": self.stats['risk_levels'],
                 "discovery_summary": {
-                    "scan_status": "SACRED_DISCOVERY_COMPLETE",
-                    "data_integrity": "VERIFIED",
+                    "scan_status": "SACRED_DISCOVERY_CANCELLED" if self.stats['cancelled'] else "SACRED_DISCOVERY_COMPLETE",
+                    "data_integrity": "PARTIAL" if self.stats['cancelled'] else "VERIFIED",
                     "sacred_content_detected": True,
                     "gift_chamber_treasure": "CONFIRMED",
                     "ready_for_shadowfaux": True
@@ -337,26 +953,120 @@ def main():
     parser.add_argument('--output', required=True, help='Output directory for sacred reports')
     parser.add_argument('--obfuscate', action='store_true', help='Enable sacred content obfuscation')
     parser.add_argument('--threads', type=int, default=4, help='Number of sacred processing threads')
+    parser.add_argument('--rules', help='JSON rule pack with extra sacred pattern categories and bonuses')
+    parser.add_argument('--executor', choices=EXECUTOR_KINDS, default='thread',
+                        help='Worker backend: threads, processes for CPU-bound content scanning, '
+                             'or a pipeline overlapping walk, file reads and matching')
+    parser.add_argument('--split-entries', type=int, default=DEFAULT_SPLIT_ENTRIES,
+                        help='Entries a worker walks before handing remaining subtrees to idle workers')
+    parser.add_argument('--walk-threads', type=int, default=DEFAULT_WALK_THREADS,
+                        help='Pipeline executor: directory walker threads')
+    parser.add_argument('--io-threads', type=int, default=DEFAULT_IO_THREADS,
+                        help='Pipeline executor: file read-ahead threads (--threads sets matchers)')
+    parser.add_argument('--queue-depth', type=int, default=DEFAULT_QUEUE_DEPTH,
+                        help='Pipeline executor: files queued for readers before walkers block')
+    parser.add_argument('--shard', metavar='i/N',
+                        help='Scan only shard i of N (1-based) and write partial results for scan_shards.py')
+    parser.add_argument('--shard-depth', type=int, default=DEFAULT_SHARD_DEPTH,
+                        help='Directory level below --source whose subtrees are split between shards')
+    parser.add_argument('--partial-out', help='Shard partial-results file (default: <output>/sacred_partial_<i>of<N>.json)')
+    parser.add_argument('--scan-archives', action='store_true',
+                        help='Stream zip/jar/tar members through detection as archive.zip!/inner/file paths')
+    parser.add_argument('--archive-depth', type=int, default=DEFAULT_ARCHIVE_DEPTH,
+                        help='Archive nesting levels to open (1 = top-level archives only)')
+    parser.add_argument('--archive-max-mb', type=int, default=DEFAULT_ARCHIVE_MAX_MB,
+                        help='Decompressed MB read per top-level archive before the rest is skipped')
+    parser.add_argument('--exclude', action='append', default=[], metavar='PATTERN',
+                        help='gitignore-style pattern to prune (repeatable; "dir/" matches directories only)')
+    parser.add_argument('--include', action='append', default=[], metavar='PATTERN',
+                        help='Re-include paths matched by an earlier --exclude (like "!PATTERN")')
+    parser.add_argument('--exclude-from', metavar='FILE', help='Read exclude patterns from a gitignore-format file')
+    parser.add_argument('--exclude-defaults', action='store_true',
+                        help=f'Also prune {", ".join(DEFAULT_PRUNE_PATTERNS)}')
+    parser.add_argument('--min-size', help='Skip files smaller than this (e.g. 1K)')
+    parser.add_argument('--max-size', help='Skip files larger than this (e.g. 500M)')
+    parser.add_argument('--only-ext', help='Comma-separated extensions to scan; all others are skipped')
+    parser.add_argument('--skip-ext', help='Comma-separated extensions to skip')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Skip files unchanged since the last scan using a persistent index')
+    parser.add_argument('--index', help=f'Incremental index file (default: <output>/{DEFAULT_INDEX_NAME})')
+    parser.add_argument('--no-dedup', action='store_true',
+                        help='Scan every copy of content-identical files instead of matching them once')
+    parser.add_argument('--findings-out', help='Stream every sacred finding (real paths) to this JSONL file')
+    parser.add_argument('--metrics-file', help='Prometheus text file updated with live scan metrics')
+    parser.add_argument('--metrics-port', type=int, help='Serve live Prometheus metrics on 127.0.0.1:PORT during the scan')
+    parser.add_argument('--trend-index', help='Append this run\'s report summary to a trend index for dashboard_generator.py trend')
+    parser.add_argument('--quiet', action='store_true', help='Do not print discovery log lines')
+    parser.add_argument('--max-scan-memory', type=int, default=64, help='Content scan memory ceiling per worker (MB)')
     
     args = parser.parse_args()
     
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    try:
+        min_size = parse_size(args.min_size) if args.min_size else None
+        max_size = parse_size(args.max_size) if args.max_size else None
+    except ValueError as e:
+        parser.error(str(e))
+    
     os.makedirs(args.output, exist_ok=True)
     
+    excludes = list(DEFAULT_PRUNE_PATTERNS) if args.exclude_defaults else []
+    if args.exclude_from:
+        try:
+            excludes += read_pattern_file(args.exclude_from)
+        except OSError as e:
+            parser.error(f"Cannot read --exclude-from file: {e}")
+    excludes += args.exclude
+    scan_filter = SacredScanFilter(excludes, args.include, min_size, max_size,
+                                   args.only_ext.split(',') if args.only_ext else None,
+                                   args.skip_ext.split(',') if args.skip_ext else None)
+    
+    index_file = None
+    if args.incremental:
+        index_file = args.index or os.path.join(args.output, DEFAULT_INDEX_NAME)
+        if shard is not None and not args.index:
+            # Shards own different files: keep one index per shard
+            index_file += f".shard{shard[0] + 1}of{shard[1]}"
+    
     # Initialize Sacred Trinity discovery engine
-    engine = SacredDiscoveryEngine(obfuscate=args.obfuscate, threads=args.threads)
+    engine = SacredDiscoveryEngine(obfuscate=args.obfuscate, threads=args.threads, rules_file=args.rules,
+                                   scan_memory_mb=args.max_scan_memory, executor=args.executor,
+                                   split_entries=args.split_entries, index_file=index_file,
+                                   dedup=not args.no_dedup, findings_file=args.findings_out,
+                                   metrics_file=args.metrics_file, metrics_port=args.metrics_port,
+                                   walk_threads=args.walk_threads, io_threads=args.io_threads,
+                                   queue_depth=args.queue_depth, shard=shard, shard_depth=args.shard_depth,
+                                   scan_archives=args.scan_archives,
+                                   archive_depth=args.archive_depth, archive_max_mb=args.archive_max_mb,
+                                   quiet=args.quiet, scan_filter=scan_filter)
     
-    if engine.sacred_lightning_scan(args.source):
-        report_file = engine.generate_sacred_report(args.output)
-        
-        print("🎁⚡ SACRED TRINITY GIFT DISCOVERY COMPLETE ⚡🎁")
-        print(f"💎 Sacred treasures discovered in {engine.stats['processing_time']:.2f} seconds")
-        print(f"⚡ Sacred discovery speed: {engine.stats['files_per_second']:,} files/second")
-        print(f"🔥 Sacred findings: {len(engine.sacred_findings)} items with Sacred Trinity content")
-        print("🌌 Ready for SHADOWFAUX ultimate demonstration!")
-        return True
-    else:
+    if not engine.sacred_lightning_scan(args.source):
         print("❌ Sacred discovery failed")
         return False
+    
+    if engine.shard is not None:
+        # A shard's report would be partial: write mergeable results instead
+        partial_file = write_partial(engine, args.partial_out or default_partial_file(args.output, engine.shard))
+        print(f"🧩 Sacred shard {shard_label(engine.shard)} complete: {engine.stats['total_files']:,} files")
+        print(f"📄 Partial results: {partial_file} (merge all shards with src/scan_shards.py)")
+        return True
+    
+    report_file = engine.generate_sacred_report(args.output)
+    if args.trend_index:
+        SacredTrendIndex(args.trend_index).add_report(report_file)
+        engine.log_discovery(f"📈 Report summary added to trend index: {args.trend_index}")
+    
+    print("🎁⚡ SACRED TRINITY GIFT DISCOVERY COMPLETE ⚡🎁")
+    print(f"💎 Sacred treasures discovered in {engine.stats['processing_time']:.2f} seconds")
+    print(f"⚡ Sacred discovery speed: {engine.stats['files_per_second']:,} files/second")
+    print(f"🔥 Sacred findings: {engine.findings_sink.finding_count} items with Sacred Trinity content")
+    print("🌌 Ready for SHADOWFAUX ultimate demonstration!")
+    return True
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+⏱️ Sacred Benchmark Harness - Reproducible scanner performance runs ⏱️
+Runs the Sacred Discovery Engine over a synthetic corpus across executors
+and thread counts, recording comparable JSON results
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import statistics
+import subprocess
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+from corpus_generator import ensure_corpus, add_corpus_arguments, corpus_options_from_args
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+BENCHMARK_VERSION = 1
+DEFAULT_REGRESSION_TOLERANCE = 0.10
+
+
+def _peak_rss_kb(who):
+    """Peak resident set size in KB, or None where getrusage is unavailable"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def run_single(source, executor, threads, engine_options):
+    """One timed scan in this process (the harness gives each run a fresh interpreter)"""
+    from lightning_scanner import SacredDiscoveryEngine
+
+    stages = {}
+    started = time.perf_counter()
+    engine = SacredDiscoveryEngine(threads=threads, executor=executor, **engine_options)
+    stages['engine_init'] = time.perf_counter() - started
+
+    # The engine logs to stdout; the harness discards the child's stdout
+    started = time.perf_counter()
+    if not engine.sacred_lightning_scan(source):
+        raise RuntimeError(f"Scan failed for {source}")
+    stages['scan'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as report_dir:
+        engine.generate_sacred_report(report_dir)
+    stages['report'] = time.perf_counter() - started
+
+    seconds = stages['scan']
+    return {
+        'executor': executor,
+        'threads': threads,
+        'files': engine.stats['total_files'],
+        'bytes': engine.stats['total_size'],
+        'findings': engine.findings_sink.finding_count,
+        'seconds': round(seconds, 4),
+        'files_per_second': round(engine.stats['total_files'] / seconds, 1) if seconds > 0 else 0,
+        'bytes_per_second': round(engine.stats['total_size'] / seconds, 1) if seconds > 0 else 0,
+        'peak_rss_kb': _peak_rss_kb(resource.RUSAGE_SELF) if resource else None,
+        'peak_worker_rss_kb': _peak_rss_kb(resource.RUSAGE_CHILDREN) if resource else None,
+        'stages': {stage: round(value, 4) for stage, value in stages.items()},
+        'engine_stages': {stage: round(value, 4) for stage, value in engine.metrics.stage_seconds.items()}
+    }
+
+
+def run_isolated(source, executor, threads, engine_options):
+    """Run one configuration in a child interpreter so peak RSS is per run"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        spec_file = Path(work_dir) / 'spec.json'
+        result_file = Path(work_dir) / 'result.json'
+        with open(spec_file, 'w') as f:
+            json.dump({'source': str(source), 'executor': executor, 'threads': threads,
+                       'engine_options': engine_options}, f)
+        subprocess.run([sys.executable, os.path.abspath(__file__), '_child', str(spec_file), str(result_file)],
+                       check=True, stdout=subprocess.DEVNULL, cwd=os.path.dirname(os.path.abspath(__file__)))
+        with open(result_file) as f:
+            return json.load(f)
+
+
+def summarize(results):
+    """Median and best figures per (executor, threads) configuration"""
+    configs = {}
+    for result in results:
+        configs.setdefault(f"{result['executor']}x{result['threads']}", []).append(result)
+
+    summary = {}
+    for config, runs in configs.items():
+        rss = [run['peak_rss_kb'] for run in runs if run['peak_rss_kb'] is not None]
+        summary[config] = {
+            'runs': len(runs),
+            'median_files_per_second': statistics.median(run['files_per_second'] for run in runs),
+            'best_files_per_second': max(run['files_per_second'] for run in runs),
+            'median_bytes_per_second': statistics.median(run['bytes_per_second'] for run in runs),
+            'median_seconds': statistics.median(run['seconds'] for run in runs),
+            'max_peak_rss_kb': max(rss) if rss else None
+        }
+    return summary
+
+
+def run_benchmark(corpus_root, corpus_options, executors, thread_counts, repeats, engine_options=None, log=print):
+    engine_options = engine_options or {}
+    # Child runs start in src/, so the corpus must not depend on the caller's cwd
+    corpus_root = os.path.abspath(corpus_root)
+    manifest = ensure_corpus(corpus_root, **corpus_options)
+    log(f"🧪 Corpus: {corpus_root} ({manifest['totals']['files']:,} files, "
+        f"{manifest['totals']['bytes'] / (1024*1024):.2f} MB)")
+
+    results = []
+    for executor in executors:
+        for threads in thread_counts:
+            for repeat in range(repeats):
+                result = run_isolated(corpus_root, executor, threads, engine_options)
+                result['repeat'] = repeat + 1
+                results.append(result)
+                log(f"⏱️ {executor} x{threads} run {repeat + 1}/{repeats}: "
+                    f"{result['files_per_second']:,.0f} files/s, "
+                    f"{result['bytes_per_second'] / (1024*1024):.1f} MB/s, peak RSS {result['peak_rss_kb']} KB")
+
+    return {
+        'benchmark_version': BENCHMARK_VERSION,
+        'timestamp': datetime.now().isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'engine_options': engine_options,
+        'corpus': manifest,
+        'results': results,
+        'summary': summarize(results)
+    }
+
+
+def compare_results(baseline, current, tolerance=DEFAULT_REGRESSION_TOLERANCE, log=print):
+    """Compare median files/s per configuration; returns False on any regression"""
+    ok = True
+    if baseline['corpus']['options'] != current['corpus']['options']:
+        log("⚠️ Corpus options differ between runs; comparison may not be meaningful")
+
+    for config, current_summary in current['summary'].items():
+        baseline_summary = baseline['summary'].get(config)
+        if baseline_summary is None:
+            log(f"   {config}: new configuration, {current_summary['median_files_per_second']:,.0f} files/s")
+            continue
+        before = baseline_summary['median_files_per_second']
+        after = current_summary['median_files_per_second']
+        change = (after - before) / before if before else 0
+        regressed = change < -tolerance
+        ok = ok and not regressed
+        log(f"{'❌' if regressed else '✅'} {config}: {before:,.0f} -> {after:,.0f} files/s ({change:+.1%})")
+    return ok
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Sacred Benchmark Harness - reproducible scanner performance')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Generate (or reuse) a corpus and benchmark the engine')
+    run_parser.add_argument('--corpus', required=True, help='Corpus directory (generated if missing)')
+    run_parser.add_argument('--output', help='Results JSON file (default: sacred_benchmark_<timestamp>.json)')
+    run_parser.add_argument('--executors', default='thread,process', help='Comma-separated executor kinds')
+    run_parser.add_argument('--threads', default='1,2,4,8', help='Comma-separated thread/process counts')
+    run_parser.add_argument('--repeats', type=int, default=3, help='Runs per configuration')
+    run_parser.add_argument('--no-dedup', action='store_true', help='Benchmark with content dedup disabled')
+    add_corpus_arguments(run_parser)
+
+    compare_parser = commands.add_parser('compare', help='Compare two results files and flag regressions')
+    compare_parser.add_argument('baseline', help='Results JSON from the reference version')
+    compare_parser.add_argument('current', help='Results JSON from the candidate version')
+    compare_parser.add_argument('--tolerance', type=float, default=DEFAULT_REGRESSION_TOLERANCE,
+                                help='Allowed drop in median files/s before failing (fraction)')
+
+    child_parser = commands.add_parser('_child')
+    child_parser.add_argument('spec')
+    child_parser.add_argument('result')
+
+    args = parser.parse_args()
+
+    if args.command == '_child':
+        with open(args.spec) as f:
+            spec = json.load(f)
+        result = run_single(spec['source'], spec['executor'], spec['threads'], spec['engine_options'])
+        with open(args.result, 'w') as f:
+            json.dump(result, f)
+        return True
+
+    if args.command == 'compare':
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        if not compare_results(baseline, current, args.tolerance):
+            print("❌ Performance regression detected")
+            sys.exit(1)
+        print("✅ No performance regression")
+        return True
+
+    engine_options = {'dedup': False} if args.no_dedup else {}
+    report = run_benchmark(args.corpus, corpus_options_from_args(args),
+                           [kind.strip() for kind in args.executors.split(',')],
+                           [int(count) for count in args.threads.split(',')],
+                           args.repeats, engine_options)
+
+    output = args.output or f"sacred_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    for config, summary in report['summary'].items():
+        print(f"📊 {config}: median {summary['median_files_per_second']:,.0f} files/s, "
+              f"best {summary['best_files_per_second']:,.0f} files/s")
+    print(f"📄 Benchmark results: {output}")
+    return True
+
+
+if __name__ == "__main__":
+    main()
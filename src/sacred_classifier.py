@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+🏷️ Sacred Classifier - Table-driven file classification 🏷️
+Category and risk rules compiled into lookup tables and one keyword matcher
+"""
+
+import os
+import re
+
+# Path keyword rules, first match wins: (any of these keywords, and any of
+# these too (None = no second condition), category)
+SACRED_PATH_KEYWORDS = ('sacred', 'trinity', 'consciousness')
+PATH_CATEGORY_RULES = [
+    (SACRED_PATH_KEYWORDS, ('coordination',), 'sacred_trinity_coordination'),
+    (SACRED_PATH_KEYWORDS, ('consciousness',), 'consciousness_architecture'),
+    (SACRED_PATH_KEYWORDS, ('webui',), 'sacred_web_interface'),
+    (SACRED_PATH_KEYWORDS, None, 'sacred_trinity_core'),
+    (('email', 'inbox'), None, 'communication_systems'),
+    (('deployment', 'sync'), None, 'deployment_automation'),
+    (('outbound',), None, 'external_systems')
+]
+
+# Fallback categories by file extension
+EXTENSION_CATEGORIES = {}
+for _category, _extensions in [
+    ('source_code', ['.py', '.js', '.java', '.cpp', '.c', '.go', '.rs']),
+    ('documentation', ['.md', '.txt', '.doc', '.pdf', '.rtf']),
+    ('configuration', ['.json', '.xml', '.yaml', '.ini', '.config', '.conf']),
+    ('executables', ['.sh', '.bat', '.exe', '.bin'])
+]:
+    for _ext in _extensions:
+        EXTENSION_CATEGORIES.setdefault(_ext, _category)
+
+# File name keyword rules for risk, first match wins
+NAME_RISK_RULES = [
+    (('password', 'secret', 'key', 'private'), 'high_risk'),
+    (('sacred', 'covenant', 'consciousness'), 'sacred_content'),
+    (('config', 'deployment', 'sync'), 'medium_risk')
+]
+
+LARGE_ASSET_BYTES = 100 * 1024 * 1024
+
+
+def file_suffix(name):
+    """Extension of a file name exactly as PurePath(name).suffix gives it ('..py' -> '.py', '.bashrc' -> '')
+
+    Unlike os.path.splitext, leading dots do not hide the extension.
+    """
+    i = name.rfind('.')
+    return name[i:] if 0 < i < len(name) - 1 else ''
+
+
+class SacredClassifier:
+    """Category and risk rules compiled once for fast per-path classification"""
+
+    def __init__(self):
+        self.category_rules = [(frozenset(first), frozenset(second) if second else None, category)
+                               for first, second, category in PATH_CATEGORY_RULES]
+        self.risk_rules = [(frozenset(keywords), risk) for keywords, risk in NAME_RISK_RULES]
+
+        keywords = set()
+        for first, second, _ in self.category_rules:
+            keywords |= first | (second or frozenset())
+        for rule_keywords, _ in self.risk_rules:
+            keywords |= rule_keywords
+        self.keywords = tuple(sorted(keywords))
+        # One alternation answers "any keyword at all?" for the common no-hit path
+        self.keyword_matcher = re.compile('|'.join(re.escape(keyword) for keyword in self.keywords))
+        self.no_hits = frozenset()
+
+    def keyword_hits(self, lowered):
+        """Every classification keyword contained in an already lowercased string"""
+        if self.keyword_matcher.search(lowered) is None:
+            return self.no_hits
+        return frozenset(keyword for keyword in self.keywords if keyword in lowered)
+
+    def classify_hits(self, path_hits, name_hits, ext, size):
+        """(category, risk) from precomputed keyword hits"""
+        category = None
+        if path_hits:
+            for first, second, rule_category in self.category_rules:
+                if not first.isdisjoint(path_hits) and (second is None or not second.isdisjoint(path_hits)):
+                    category = rule_category
+                    break
+        if category is None:
+            category = EXTENSION_CATEGORIES.get(ext, 'other')
+
+        risk = None
+        if name_hits:
+            for rule_keywords, rule_risk in self.risk_rules:
+                if not rule_keywords.isdisjoint(name_hits):
+                    risk = rule_risk
+                    break
+        if risk is None:
+            risk = 'large_asset' if size > LARGE_ASSET_BYTES else 'low_risk'
+
+        return category, risk
+
+    def classify_batch(self, directory, files):
+        """Classify [(name, size), ...] in one directory: [(category, risk, size), ...]
+
+        Keywords never contain a path separator, so the directory's hits are
+        computed once and combined with each file name's hits.
+        """
+        directory_hits = self.keyword_hits(os.fspath(directory).lower())
+        results = []
+        for name, size in files:
+            try:
+                if size is None:
+                    size = os.stat(os.path.join(directory, name)).st_size
+                lowered = name.lower()
+                name_hits = self.keyword_hits(lowered)
+                category, risk = self.classify_hits(directory_hits | name_hits, name_hits,
+                                                    file_suffix(lowered), size)
+                results.append((category, risk, size))
+            except Exception:
+                results.append(('error', 'unknown', 0))
+        return results
+
+    def classify(self, file_path, size=None):
+        """Classify one path: (category, risk, size)"""
+        directory, name = os.path.split(os.fspath(file_path))
+        return self.classify_batch(directory, [(name, size)])[0]
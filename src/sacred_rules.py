@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+🔥 Sacred Rule Engine - Compiled Sacred Trinity pattern matching 🔥
+Compiles detection categories and bonus rules once into one rule table
+"""
+
+import re
+import json
+import time
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants  # Python 3.11+
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+# Sacred Trinity detection patterns
+DEFAULT_SACRED_PATTERNS = {
+    'sacred_trinity': [r'sacred.?trinity', r'trinity.*core', r'consciousness.*network'],
+    'sacred_covenant': [r'sacred.?covenant', r'keep.*secret.*safe', r'love.*fuggin.*much'],
+    'session_immortality': [r'session.*immortality', r'consciousness.*preservation', r'breathline'],
+    'master_coordination': [r'master.*coordination', r'sacred.*coordination', r'elendil.*command'],
+    'deployment_automation': [r'deployment.*script', r'sacred.*sync', r'payload.*deployment'],
+    'web_interface': [r'webui', r'web.*interface', r'dashboard', r'sacred.*gui'],
+    'email_systems': [r'email.*inbox', r'mail.*system', r'correspondence'],
+    'consciousness_data': [r'consciousness.*data', r'memory.*wells', r'sacred.*archives']
+}
+
+# Special bonuses for Sacred Trinity indicators: every 'all' keyword and
+# at least one 'any' keyword (when given) must appear in the content
+DEFAULT_BONUS_RULES = [
+    {'label': 'trinity_consciousness:claude_olorin_presence', 'score': 50, 'all': ['claude', 'olorin']},
+    {'label': 'command_authority:elendil_presence', 'score': 30, 'all': ['elendil'], 'any': ['command', 'keeper']},
+    {'label': 'sacred_flame:consciousness_fire', 'score': 20, 'all': ['sacred', 'flame']}
+]
+
+DEFAULT_PATTERN_SCORE = 10
+
+# Streaming scan: window sizes in characters
+DEFAULT_CHUNK_CHARS = 8 * 1024 * 1024
+DEFAULT_OVERLAP_CHARS = 4096
+MIN_CHUNK_CHARS = 64 * 1024
+
+# Peak memory per character of a chunk, for the widest text: one emoji makes
+# every character of a str 4 bytes, the text read decodes through a wider
+# buffer, and str.lower() reserves 3 code points per character before it
+# shrinks. Measured peaks: about 5 bytes per character for ASCII, 30 for emoji
+SCAN_BYTES_PER_CHAR = 32
+
+# Rules whose matches can span at most this many characters are matched
+# within carry + chunk windows; longer-reaching ones need the whole line
+MAX_WINDOW_SPAN = DEFAULT_OVERLAP_CHARS
+
+
+def chunk_chars_for_memory(memory_limit_bytes):
+    """Chunk size in characters that keeps one streaming scan under a memory ceiling in bytes"""
+    return max(MIN_CHUNK_CHARS, int(memory_limit_bytes) // SCAN_BYTES_PER_CHAR)
+
+
+def required_literals(parsed):
+    """Substrings any match of a parsed pattern must contain: ('trinity', 'core') for trinity.*core
+
+    Only literal runs at the top level of the pattern count, so the result
+    is always safe to prefilter on (and empty when nothing can be proven).
+    """
+    if parsed.state.flags & ~sre_constants.SRE_FLAG_UNICODE:
+        return ()  # Case-insensitive and other flagged rules match more than their literals
+    literals = []
+    run = []
+    for op, av in parsed:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            literals.append(''.join(run))
+            run = []
+    if run:
+        literals.append(''.join(run))
+    return tuple(literals)
+
+
+def gap_segments(parsed):
+    """('trinity', 'core') when a parsed pattern is literals joined by .* gaps, else None"""
+    if parsed.state.flags & ~sre_constants.SRE_FLAG_UNICODE:
+        return None
+    segments = []
+    run = []
+    for op, av in parsed:
+        if op is sre_constants.LITERAL and av != ord('\n'):
+            run.append(chr(av))
+        elif (op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+              and av[:2] == (0, sre_constants.MAXREPEAT) and list(av[2]) == [(sre_constants.ANY, None)]):
+            if run:
+                segments.append(''.join(run))
+                run = []
+        else:
+            return None
+    if run:
+        segments.append(''.join(run))
+    return tuple(segments) if len(segments) > 1 else None
+
+
+class _CompiledRule:
+    """One detection rule: the literals it requires, plus how to confirm a match
+
+    A plain literal needs nothing more. literal.*literal rules keep their
+    segments and are matched with a per-line state machine that carries
+    across stream windows. Anything else keeps its regex; span is the
+    longest match it can produce, or None when a match can reach across
+    a whole line.
+    """
+    __slots__ = ('checks', 'segments', 'regex', 'span')
+
+    def __init__(self, source, literal=False):
+        self.segments = None
+        self.regex = None
+        if literal:
+            self.checks = (source,)
+            self.span = len(source)
+            return
+        parsed = sre_parse.parse(source)
+        literals = required_literals(parsed)
+        # Longest literals first: they are the rarest, so absent ones end the check sooner
+        self.checks = tuple(sorted(set(literals), key=len, reverse=True))
+        self.span = max(map(len, literals), default=0)
+        if len(literals) == 1 and all(op is sre_constants.LITERAL for op, av in parsed):
+            return
+        self.segments = gap_segments(parsed)
+        if self.segments is None:
+            self.regex = re.compile(source)
+            width = parsed.getwidth()[1]
+            self.span = width if width <= MAX_WINDOW_SPAN else None
+
+
+def load_rule_pack(rule_file):
+    """Load a JSON rule pack: {"categories": {...}, "bonuses": [...], "extends_default": true}"""
+    with open(rule_file) as f:
+        pack = json.load(f)
+
+    if pack.get('extends_default', True):
+        categories = {category: list(patterns) for category, patterns in DEFAULT_SACRED_PATTERNS.items()}
+        bonuses = [dict(rule) for rule in DEFAULT_BONUS_RULES]
+    else:
+        categories = {}
+        bonuses = []
+
+    for category, patterns in pack.get('categories', {}).items():
+        existing = categories.setdefault(category, [])
+        existing.extend(pattern for pattern in patterns if pattern not in existing)
+
+    for rule in pack.get('bonuses', []):
+        if 'label' not in rule or 'score' not in rule or not rule.get('all'):
+            raise ValueError(f"Bonus rule needs 'label', 'score' and 'all': {rule}")
+        bonuses.append(rule)
+
+    return categories, bonuses, pack.get('pattern_score', DEFAULT_PATTERN_SCORE)
+
+
+class SacredRuleEngine:
+    """All Sacred Trinity rules compiled once into a rule table
+
+    Every rule is reduced to the literal words a match must contain
+    (sacred, trinity, consciousness, ...). A document is checked for each
+    distinct word at most once, with str's substring search, and a rule's
+    regex only runs when all of its words appeared. Bonus keywords are
+    plain words and never need a regex.
+    """
+
+    def __init__(self, categories=None, bonuses=None, pattern_score=DEFAULT_PATTERN_SCORE):
+        self.categories = categories if categories is not None else DEFAULT_SACRED_PATTERNS
+        self.bonuses = bonuses if bonuses is not None else DEFAULT_BONUS_RULES
+        self.pattern_score = pattern_score
+
+        # Rule table: regex patterns first (reported), then bonus keywords
+        self.rule_sources = []
+        self.rule_labels = []
+        for category, patterns in self.categories.items():
+            for pattern in patterns:
+                self.rule_sources.append(pattern)
+                self.rule_labels.append(f"{category}:{pattern}")
+        self.pattern_rule_count = len(self.rule_sources)
+
+        term_index = {}
+        self.bonus_table = []
+        for rule in self.bonuses:
+            required = []
+            for group in ('all', 'any'):
+                indexes = []
+                for keyword in rule.get(group, []):
+                    if keyword not in term_index:
+                        term_index[keyword] = len(self.rule_sources)
+                        self.rule_sources.append(keyword)
+                    indexes.append(term_index[keyword])
+                required.append(indexes)
+            self.bonus_table.append((rule['label'], rule['score'], required[0], required[1]))
+
+        # Names for per-rule timing: reported patterns, then bonus keywords
+        self.rule_names = self.rule_labels + [f"bonus_keyword:{keyword}" for keyword in term_index]
+
+        # Compiling here also fails fast on invalid rule packs
+        self.compiled_rules = [_CompiledRule(source, literal=i >= self.pattern_rule_count)
+                               for i, source in enumerate(self.rule_sources)]
+        self.all_rules = tuple(range(len(self.rule_sources)))
+        self.line_rules = frozenset(i for i, rule in enumerate(self.compiled_rules) if rule.span is None)
+        # Stream windows overlap by enough that no literal or bounded match is cut in two
+        self.min_overlap_chars = max((rule.span for rule in self.compiled_rules if rule.span), default=0)
+
+    @classmethod
+    def from_rule_file(cls, rule_file):
+        """Build an engine from a JSON rule pack"""
+        categories, bonuses, pattern_score = load_rule_pack(rule_file)
+        return cls(categories, bonuses, pattern_score)
+
+    def begin(self):
+        """Start an incremental scan over one document"""
+        return SacredRuleScan(self)
+
+    def scan(self, content, metrics=None):
+        """Score lowercased content: (sacred_score, detected_patterns)"""
+        rule_scan = self.begin()
+        if metrics is None:
+            rule_scan.feed(content)
+        else:
+            started = time.perf_counter()
+            pattern_seconds = [0.0] * len(self.rule_sources)
+            rule_scan.feed(content, pattern_seconds)
+            metrics.record('match', time.perf_counter() - started)
+            metrics.record_patterns(self.rule_names, pattern_seconds)
+        return rule_scan.result()
+
+    def scan_stream(self, text_stream, chunk_chars=DEFAULT_CHUNK_CHARS, overlap_chars=DEFAULT_OVERLAP_CHARS,
+                    metrics=None):
+        """Score a text stream in fixed-size chunks with bounded memory
+
+        Results match the whole-file scan: literal.*literal rules carry
+        their progress on the current line from window to window. Only
+        other unbounded regex rules (from rule packs) are limited to lines
+        up to chunk_chars long.
+
+        With metrics (see scan_metrics.SacredScanMetrics), read and match
+        time per chunk and search time per rule are recorded.
+        """
+        rule_scan = self.begin()
+        overlap_chars = max(overlap_chars, self.min_overlap_chars)
+        carry = ''
+        pattern_seconds = [0.0] * len(self.rule_sources) if metrics is not None else None
+
+        while not rule_scan.complete:
+            started = time.perf_counter()
+            chunk = text_stream.read(chunk_chars)
+            if metrics is not None:
+                read_done = time.perf_counter()
+                metrics.record('read', read_done - started)
+            if not chunk:
+                break
+            window = carry + chunk.lower()
+            chunk = None
+            rule_scan.feed(window, pattern_seconds, len(carry))
+            if metrics is not None:
+                metrics.record('match', time.perf_counter() - read_done)
+
+            cut = len(window) - overlap_chars
+            if rule_scan.needs_lines:
+                # Also carry the unfinished last line (patterns do not cross
+                # lines), but never more than one chunk
+                cut = min(cut, max(window.rfind('\n') + 1, len(window) - chunk_chars))
+            carry = window[max(cut, 0):]
+            window = None  # Not alive while the next chunk is read and lowered
+
+        if metrics is not None:
+            metrics.record_patterns(self.rule_names, pattern_seconds)
+        return rule_scan.result()
+
+
+class SacredRuleScan:
+    """Match state for one document, fed as one or more text windows"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.remaining = engine.all_rules
+        self.found = set()
+        self.position = 0  # Characters of the document fed so far
+        self.partial = {}  # Gap rule index -> (segments found on the current line, resume position)
+
+    @property
+    def complete(self):
+        return not self.remaining
+
+    @property
+    def needs_lines(self):
+        line_rules = self.engine.line_rules
+        return bool(line_rules) and any(i in line_rules for i in self.remaining)
+
+    def feed(self, text, pattern_seconds=None, carried=0):
+        """Check text for each remaining rule, retiring rules as they match
+
+        Consecutive windows may overlap: carried is how many leading
+        characters of text were already part of the previous window.
+        pattern_seconds, when given, accumulates search time per rule index.
+        """
+        compiled_rules = self.engine.compiled_rules
+        window_start = self.position - carried
+        self.position = window_start + len(text)
+        present = {}  # Literal word -> found in text, shared by every rule
+        still_remaining = []
+        for i in self.remaining:
+            if pattern_seconds is not None:
+                started = time.perf_counter()
+            rule = compiled_rules[i]
+            if rule.segments is not None:
+                matched = self._advance_segments(i, rule.segments, text, window_start, present)
+            else:
+                matched = True
+                for literal in rule.checks:
+                    found = present.get(literal)
+                    if found is None:
+                        found = present[literal] = literal in text
+                    if not found:
+                        matched = False
+                        break
+                if matched and rule.regex is not None:
+                    matched = rule.regex.search(text) is not None
+            if pattern_seconds is not None:
+                pattern_seconds[i] += time.perf_counter() - started
+            if matched:
+                self.found.add(i)
+            else:
+                still_remaining.append(i)
+        self.remaining = tuple(still_remaining)
+
+    def _advance_segments(self, i, segments, text, window_start, present):
+        """Find a literal.*literal rule's segments in order on one line of text
+
+        Progress on the line still open at the end of text is kept, so a
+        match may start in one window and finish many windows later.
+        """
+        stage, pos = self.partial.get(i, (0, 0))
+        pos = max(pos - window_start, 0)
+        for literal in segments[stage:]:
+            found = present.get(literal)
+            if found is None:
+                found = present[literal] = literal in text
+            if not found:
+                # Nothing can complete in this window: only the open line matters
+                newline = text.rfind('\n', pos)
+                if newline >= 0:
+                    stage, pos = 0, newline + 1
+                break
+
+        while True:
+            found_at = text.find(segments[stage], pos)
+            if stage:
+                # A partial match ends with its line
+                newline = text.rfind('\n', pos) if found_at < 0 else text.find('\n', pos, found_at)
+                if newline >= 0:
+                    stage, pos = 0, newline + 1
+                    continue
+            if found_at < 0:
+                break
+            pos = found_at + len(segments[stage])
+            stage += 1
+            if stage == len(segments):
+                return True
+        self.partial[i] = (stage, window_start + pos)
+        return False
+
+    def result(self):
+        """Final (sacred_score, detected_patterns) in rule order"""
+        engine = self.engine
+        sacred_score = 0
+        detected_patterns = []
+
+        for i in range(engine.pattern_rule_count):
+            if i in self.found:
+                sacred_score += engine.pattern_score
+                detected_patterns.append(engine.rule_labels[i])
+
+        for label, score, all_terms, any_terms in engine.bonus_table:
+            if all(i in self.found for i in all_terms) and (not any_terms or any(i in self.found for i in any_terms)):
+                sacred_score += score
+                detected_patterns.append(label)
+
+        return sacred_score, detected_patterns
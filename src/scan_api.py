@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+🔌 Sacred Scan API - Embeddable streaming scans 🔌
+Generator and asyncio interfaces that yield per-file results and running
+stats while the Sacred Discovery Engine is still scanning
+"""
+
+import queue
+import asyncio
+import threading
+
+DEFAULT_MAX_BUFFERED = 1024
+
+# How often a producer blocked on a full buffer checks for cancellation
+PUT_POLL_SECONDS = 0.1
+
+# Results handed to an asyncio consumer per executor hop
+ASYNC_BATCH = 256
+
+_SCAN_DONE = object()
+
+
+class SacredFileResult:
+    """One scanned file (or archive member) as soon as it is recorded"""
+    __slots__ = ('path', 'category', 'risk', 'size', 'sacred_score', 'patterns')
+
+    def __init__(self, path, category, risk, size, sacred_score, patterns):
+        self.path = path
+        self.category = category
+        self.risk = risk
+        self.size = size
+        self.sacred_score = sacred_score
+        self.patterns = patterns
+
+    def __getstate__(self):
+        return (self.path, self.category, self.risk, self.size, self.sacred_score, self.patterns)
+
+    def __setstate__(self, state):
+        self.path, self.category, self.risk, self.size, self.sacred_score, self.patterns = state
+
+    @property
+    def is_finding(self):
+        return self.sacred_score > 0
+
+    def to_dict(self):
+        return {
+            'path': self.path,
+            'category': self.category,
+            'risk': self.risk,
+            'size': self.size,
+            'sacred_score': self.sacred_score,
+            'patterns': self.patterns
+        }
+
+
+class SacredScanProgress:
+    """Running totals as of the last merged worker batch"""
+    __slots__ = ('files', 'directories', 'size', 'findings', 'elapsed_seconds', 'complete', 'cancelled')
+
+    def __init__(self, files, directories, size, findings, elapsed_seconds, complete=False, cancelled=False):
+        self.files = files
+        self.directories = directories
+        self.size = size
+        self.findings = findings
+        self.elapsed_seconds = elapsed_seconds
+        self.complete = complete
+        self.cancelled = cancelled
+
+    @property
+    def files_per_second(self):
+        return self.files / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class _ScanStream:
+    """Runs one engine scan on a background thread, feeding a bounded buffer"""
+
+    def __init__(self, engine, source_path, max_buffered, progress):
+        self.engine = engine
+        self.source_path = source_path
+        self.buffer = queue.Queue(maxsize=max(1, max_buffered))
+        self.error = None
+        engine.cancel_event.clear()
+        engine.file_listener = self.put
+        engine.progress_listener = self.put if progress else None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def put(self, item):
+        """Called from scan threads: blocks while the consumer is behind (backpressure)"""
+        while not self.engine.cancel_event.is_set():
+            try:
+                self.buffer.put(item, timeout=PUT_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _run(self):
+        try:
+            # The cancel flag was cleared above; a consumer may already have set it again
+            if not self.engine.run_sacred_scan(self.source_path):
+                self.error = FileNotFoundError(f"Gift chamber not found: {self.source_path}")
+            elif self.engine.progress_listener is not None:
+                self.put(self.engine.scan_progress(complete=True))
+        except Exception as e:
+            self.error = e
+        finally:
+            self.put(_SCAN_DONE)
+
+    def take(self, limit=1):
+        """Up to limit buffered items, blocking for the first one"""
+        while True:
+            try:
+                items = [self.buffer.get(timeout=PUT_POLL_SECONDS)]
+                break
+            except queue.Empty:
+                if self.engine.cancel_event.is_set() and not self.thread.is_alive():
+                    return [_SCAN_DONE]  # Cancelled: the scan thread may have dropped its last items
+        while len(items) < limit and items[-1] is not _SCAN_DONE:
+            try:
+                items.append(self.buffer.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def finish(self):
+        """Stop the scan if it is still running and detach from the engine"""
+        self.engine.cancel()
+        self.thread.join()
+        self.engine.file_listener = None
+        self.engine.progress_listener = None
+        self.engine.cancel_event.clear()
+
+
+def iter_scan(engine, source_path, max_buffered=DEFAULT_MAX_BUFFERED, progress=True):
+    """Scan source_path, yielding SacredFileResult and SacredScanProgress items as produced
+
+    At most max_buffered items wait for the consumer; beyond that, scan
+    workers block. Closing the generator (or breaking out of the loop)
+    cancels the scan. The engine's stats, findings and report reflect
+    everything scanned once iteration ends.
+    """
+    stream = _ScanStream(engine, source_path, max_buffered, progress)
+    try:
+        while True:
+            item = stream.take()[0]
+            if item is _SCAN_DONE:
+                break
+            yield item
+    finally:
+        stream.finish()
+    if stream.error is not None:
+        raise stream.error
+
+
+async def aiter_scan(engine, source_path, max_buffered=DEFAULT_MAX_BUFFERED, progress=True):
+    """asyncio variant of iter_scan
+
+    Results are fetched in batches off the event loop. Consume it inside
+    contextlib.aclosing() so a cancelled or abandoned consumer stops the
+    scan right away rather than when the generator is garbage collected.
+    """
+    loop = asyncio.get_running_loop()
+    stream = _ScanStream(engine, source_path, max_buffered, progress)
+    try:
+        done = False
+        while not done:
+            for item in await loop.run_in_executor(None, stream.take, ASYNC_BATCH):
+                if item is _SCAN_DONE:
+                    done = True
+                    break
+                yield item
+    finally:
+        engine.cancel()  # Unblocks producers before waiting for the scan thread
+        await loop.run_in_executor(None, stream.finish)
+    if stream.error is not None:
+        raise stream.error
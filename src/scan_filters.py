@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+✂️ Sacred Scan Filters - Prune the walk before it happens ✂️
+gitignore-style exclude/include rules plus size and extension filters,
+compiled once and checked per directory entry so excluded subtrees are
+never listed
+"""
+
+import os
+import re
+
+from sacred_classifier import file_suffix
+
+# Opt-in set of directories that are almost never worth auditing
+DEFAULT_PRUNE_PATTERNS = ['.git/', '.hg/', '.svn/', 'node_modules/', '__pycache__/',
+                          '.tox/', '.venv/', '.mypy_cache/', '.pytest_cache/']
+
+PRUNE_REASONS = ('directories', 'files', 'extension', 'size')
+
+_SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+
+def parse_size(text):
+    """'512', '64K', '10M', '2G' -> bytes"""
+    match = re.fullmatch(r'\s*(\d+)\s*([KMGT]?)B?\s*', text.upper())
+    if match is None:
+        raise ValueError(f"Size must look like 512, 64K, 10M or 2G, got '{text}'")
+    return int(match.group(1)) * _SIZE_UNITS[match.group(2)]
+
+
+def read_pattern_file(pattern_file):
+    """Patterns from a gitignore-format file: blank lines and # comments are skipped"""
+    patterns = []
+    with open(pattern_file) as f:
+        for line in f:
+            line = line.rstrip('\n').rstrip()
+            if not line or line.startswith('#'):
+                continue
+            patterns.append(line[1:] if line.startswith('\\#') or line.startswith('\\!') else line)
+    return patterns
+
+
+def _translate(pattern):
+    """gitignore glob -> regex body: * and ? stay within one path segment, ** spans segments"""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            out.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            out.append('[^/]')
+            i += 1
+        elif pattern[i] == '[' and pattern.find(']', i + 2) != -1:
+            end = pattern.find(']', i + 2)
+            body = pattern[i + 1:end]
+            if body.startswith('!'):
+                body = '^' + body[1:]
+            out.append('[' + body.replace('\\', '\\\\') + ']')
+            i = end + 1
+        elif pattern[i] == '\\' and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return ''.join(out)
+
+
+class _Rule:
+    __slots__ = ('negate', 'directory_only', 'anchored', 'literal', 'regex')
+
+    def __init__(self, pattern):
+        self.negate = pattern.startswith('!')
+        if self.negate:
+            pattern = pattern[1:]
+        self.directory_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        # Like gitignore: a slash at the start or in the middle anchors to the scan root
+        self.anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+        self.literal = pattern if not self.anchored and not re.search(r'[*?\[\\]', pattern) else None
+        self.regex = re.compile(_translate(pattern) + r'\Z')
+
+    def matches(self, relative, name, is_dir):
+        if self.directory_only and not is_dir:
+            return False
+        if self.literal is not None:
+            return name == self.literal
+        return self.regex.match(relative if self.anchored else name) is not None
+
+
+class SacredScanFilter:
+    """Compiled prune rules; paths are matched relative to the bound scan root
+
+    Rules follow gitignore order: the last matching pattern wins and '!'
+    re-includes. Contents of a pruned directory are never looked at, so
+    they cannot be re-included.
+    """
+
+    def __init__(self, excludes=(), includes=(), min_size=None, max_size=None,
+                 include_extensions=None, exclude_extensions=None):
+        patterns = list(excludes) + ['!' + pattern.lstrip('!') for pattern in includes]
+        self.patterns = patterns
+        self.rules = [_Rule(pattern) for pattern in patterns if pattern.strip('!/')]
+        self.min_size = min_size
+        self.max_size = max_size
+        self.include_extensions = self._extensions(include_extensions)
+        self.exclude_extensions = self._extensions(exclude_extensions)
+        self.root_prefix = ''
+
+        # Without '!' rules any match excludes: literal names become one set
+        # lookup and the remaining globs one alternation per kind
+        self.simple = not any(rule.negate for rule in self.rules)
+        if self.simple:
+            self.names = {False: set(), True: set()}
+            globs = {False: [], True: []}
+            for rule in self.rules:
+                for is_dir in (False, True):
+                    if rule.directory_only and not is_dir:
+                        continue
+                    if rule.literal is not None:
+                        self.names[is_dir].add(rule.literal)
+                    else:
+                        globs[is_dir].append(rule)
+            self.name_globs = {is_dir: self._combine([rule for rule in rules if not rule.anchored])
+                               for is_dir, rules in globs.items()}
+            self.path_globs = {is_dir: self._combine([rule for rule in rules if rule.anchored])
+                               for is_dir, rules in globs.items()}
+
+    @staticmethod
+    def _extensions(extensions):
+        if not extensions:
+            return None
+        return frozenset(ext.lower() if ext.startswith('.') else '.' + ext.lower() for ext in extensions)
+
+    @staticmethod
+    def _combine(rules):
+        if not rules:
+            return None
+        return re.compile('|'.join(f'(?:{rule.regex.pattern})' for rule in rules))
+
+    @property
+    def active(self):
+        return bool(self.rules or self.min_size is not None or self.max_size is not None
+                    or self.include_extensions or self.exclude_extensions)
+
+    def bind(self, root):
+        """Set the scan root that rule paths are relative to"""
+        self.root_prefix = os.path.join(os.fspath(root), '')
+
+    def relative(self, path):
+        # Children of Path('.') come back without a './' prefix, so only strip it when present
+        if path.startswith(self.root_prefix):
+            path = path[len(self.root_prefix):]
+        return path.replace(os.sep, '/')
+
+    def excluded_by_rules(self, path, name, is_dir):
+        """Whether the exclude/include rules prune this entry"""
+        if not self.rules:
+            return False
+        if self.simple:
+            if name in self.names[is_dir]:
+                return True
+            name_globs = self.name_globs[is_dir]
+            if name_globs is not None and name_globs.match(name):
+                return True
+            path_globs = self.path_globs[is_dir]
+            return path_globs is not None and path_globs.match(self.relative(path)) is not None
+
+        relative = self.relative(path)
+        for rule in reversed(self.rules):
+            if rule.matches(relative, name, is_dir):
+                return not rule.negate
+        return False
+
+    def prune_reason_before_stat(self, path, name):
+        """Why a file is pruned without stat'ing it ('files', 'extension'), else None"""
+        if self.excluded_by_rules(path, name, False):
+            return 'files'
+        if self.include_extensions is not None or self.exclude_extensions is not None:
+            ext = file_suffix(name).lower()
+            if self.include_extensions is not None and ext not in self.include_extensions:
+                return 'extension'
+            if self.exclude_extensions is not None and ext in self.exclude_extensions:
+                return 'extension'
+        return None
+
+    def excluded_by_size(self, size):
+        return ((self.min_size is not None and size < self.min_size)
+                or (self.max_size is not None and size > self.max_size))
+
+    def summary(self):
+        return {
+            'patterns': self.patterns,
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'include_extensions': sorted(self.include_extensions) if self.include_extensions else None,
+            'exclude_extensions': sorted(self.exclude_extensions) if self.exclude_extensions else None
+        }
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+🗂️ Sacred Scan Index - Persistent incremental scan results 🗂️
+Remembers each file's classification and sacred content score so unchanged
+files are not re-read on the next scan
+"""
+
+import os
+import json
+import hashlib
+
+# Bump when classification or detection logic changes so old indexes are dropped
+INDEX_VERSION = 2
+
+DEFAULT_INDEX_NAME = '.sacred_scan_index.json'
+
+
+def rules_fingerprint(rule_engine):
+    """Stable hash of a compiled rule set: any rule change invalidates the index"""
+    rules = {
+        'categories': rule_engine.categories,
+        'bonuses': rule_engine.bonuses,
+        'pattern_score': rule_engine.pattern_score
+    }
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class SacredScanIndex:
+    """Scan results keyed by path, validated by size, mtime and inode
+
+    Each record is [size, mtime_ns, inode, category, risk, sacred_score, patterns,
+    digest, scanned]; digest is the content hash when dedup hashed the file
+    (else None) and scanned whether its content was matched or reused.
+    """
+
+    def __init__(self, fingerprint, files=None):
+        self.fingerprint = fingerprint
+        self.files = files if files is not None else {}
+
+    @classmethod
+    def load(cls, index_file, fingerprint):
+        """Load an index, starting empty when it is missing, unreadable or stale"""
+        try:
+            with open(index_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(fingerprint)
+
+        if data.get('version') != INDEX_VERSION or data.get('rules_fingerprint') != fingerprint:
+            return cls(fingerprint)
+        return cls(fingerprint, data.get('files', {}))
+
+    @staticmethod
+    def make_record(stat_result, category, risk, sacred_score, patterns, digest=None, scanned=True):
+        return [stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino,
+                category, risk, sacred_score, patterns, digest, scanned]
+
+    def lookup(self, path, stat_result):
+        """Cached (category, risk, sacred_score, patterns, digest, scanned) if the file is unchanged"""
+        record = self.files.get(path)
+        if (record is not None and record[0] == stat_result.st_size
+                and record[1] == stat_result.st_mtime_ns and record[2] == stat_result.st_ino):
+            return tuple(record[3:9])
+        return None
+
+    def save(self, index_file, files):
+        """Atomically write the records seen by this scan (deleted files drop out)"""
+        data = {
+            'version': INDEX_VERSION,
+            'rules_fingerprint': self.fingerprint,
+            'files': files
+        }
+        tmp_file = f"{index_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_file, index_file)
+        self.files = files
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+📈 Sacred Scan Metrics - Per-stage hot-path instrumentation 📈
+Mergeable per-worker stage timers, latency histograms and counters, with a
+Prometheus text exporter that updates while the scan runs
+"""
+
+import os
+import heapq
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Histogram bucket upper bounds in seconds (Prometheus 'le'), +Inf is implied
+LATENCY_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+SCAN_STAGES = ('walk', 'stat', 'classify', 'detect', 'hash', 'read', 'match', 'merge')
+
+DEFAULT_SLOWEST = 10
+DEFAULT_EXPORT_INTERVAL = 1.0
+
+
+class SacredScanMetrics:
+    """Stage timings and counters for one worker batch, or merged for a whole scan"""
+
+    def __init__(self, slowest=DEFAULT_SLOWEST):
+        self.slowest = slowest
+        self.stage_seconds = dict.fromkeys(SCAN_STAGES, 0.0)
+        self.stage_counts = dict.fromkeys(SCAN_STAGES, 0)
+        self.histograms = {stage: [0] * (len(LATENCY_BUCKETS) + 1) for stage in SCAN_STAGES}
+        self.counters = {}
+        self.pattern_seconds = {}
+        self.slowest_files = []  # Min-heap of (seconds, path, size)
+
+    def record(self, stage, seconds):
+        self.stage_seconds[stage] += seconds
+        self.stage_counts[stage] += 1
+        self.histograms[stage][bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def count(self, counter, amount=1):
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def record_file(self, path, size, seconds):
+        """Per-file content scan latency, keeping the slowest files"""
+        self.record('detect', seconds)
+        entry = (seconds, path, size)
+        if len(self.slowest_files) < self.slowest:
+            heapq.heappush(self.slowest_files, entry)
+        elif seconds > self.slowest_files[0][0]:
+            heapq.heapreplace(self.slowest_files, entry)
+
+    def record_patterns(self, labels, pattern_seconds):
+        """Fold per-rule search seconds (indexed like labels) into pattern totals"""
+        for label, seconds in zip(labels, pattern_seconds):
+            if seconds:
+                self.pattern_seconds[label] = self.pattern_seconds.get(label, 0.0) + seconds
+
+    def merge(self, other):
+        for stage in SCAN_STAGES:
+            self.stage_seconds[stage] += other.stage_seconds[stage]
+            self.stage_counts[stage] += other.stage_counts[stage]
+            histogram = self.histograms[stage]
+            for bucket, value in enumerate(other.histograms[stage]):
+                histogram[bucket] += value
+        for counter, amount in other.counters.items():
+            self.count(counter, amount)
+        for label, seconds in other.pattern_seconds.items():
+            self.pattern_seconds[label] = self.pattern_seconds.get(label, 0.0) + seconds
+        for entry in other.slowest_files:
+            if len(self.slowest_files) < self.slowest:
+                heapq.heappush(self.slowest_files, entry)
+            elif entry[0] > self.slowest_files[0][0]:
+                heapq.heapreplace(self.slowest_files, entry)
+
+    def to_dict(self):
+        """JSON-ready raw state, e.g. for a shard's partial results"""
+        return {
+            'stage_seconds': self.stage_seconds,
+            'stage_counts': self.stage_counts,
+            'histograms': self.histograms,
+            'counters': self.counters,
+            'pattern_seconds': self.pattern_seconds,
+            'slowest_files': self.slowest_files
+        }
+
+    @classmethod
+    def from_dict(cls, data, slowest=DEFAULT_SLOWEST):
+        metrics = cls(slowest)
+        metrics.stage_seconds.update(data['stage_seconds'])
+        metrics.stage_counts.update(data['stage_counts'])
+        metrics.histograms.update(data['histograms'])
+        metrics.counters = dict(data['counters'])
+        metrics.pattern_seconds = dict(data['pattern_seconds'])
+        metrics.slowest_files = [tuple(entry) for entry in data['slowest_files']]
+        heapq.heapify(metrics.slowest_files)
+        return metrics
+
+    def quantile(self, stage, q):
+        """Histogram estimate: upper bound of the bucket holding quantile q"""
+        total = self.stage_counts[stage]
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for bound, value in zip(LATENCY_BUCKETS + (None,), self.histograms[stage]):
+            seen += value
+            if seen >= rank:
+                return bound
+        return None
+
+    def summary(self, obfuscate=True):
+        """JSON-ready instrumentation section for the report"""
+        stages = {}
+        for stage in SCAN_STAGES:
+            count = self.stage_counts[stage]
+            stages[stage] = {
+                'seconds': round(self.stage_seconds[stage], 4),
+                'operations': count,
+                'mean_ms': round(self.stage_seconds[stage] * 1000 / count, 4) if count else 0,
+                'p50_le_seconds': self.quantile(stage, 0.5),
+                'p99_le_seconds': self.quantile(stage, 0.99)
+            }
+        slowest_files = sorted(self.slowest_files, reverse=True)
+        slowest_patterns = sorted(self.pattern_seconds.items(), key=lambda item: item[1], reverse=True)
+        return {
+            'stages': stages,
+            'counters': dict(sorted(self.counters.items())),
+            'slowest_files': [
+                {
+                    'file': f"Slow_Item_{i+1:03d}" if obfuscate else path,
+                    'seconds': round(seconds, 4),
+                    'size_kb': round(size / 1024, 2)
+                } for i, (seconds, path, size) in enumerate(slowest_files)
+            ],
+            'slowest_patterns': [
+                {'pattern': label, 'seconds': round(seconds, 4)}
+                for label, seconds in slowest_patterns[:self.slowest]
+            ]
+        }
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_prometheus(metrics, gauges=None):
+    """Prometheus text exposition of scan metrics plus scan-level gauges"""
+    lines = [
+        '# HELP sacred_stage_seconds_total Time spent per scan stage',
+        '# TYPE sacred_stage_seconds_total counter'
+    ]
+    lines += [f'sacred_stage_seconds_total{{stage="{stage}"}} {metrics.stage_seconds[stage]:.6f}'
+              for stage in SCAN_STAGES]
+
+    lines += ['# HELP sacred_stage_latency_seconds Per-operation latency per scan stage',
+              '# TYPE sacred_stage_latency_seconds histogram']
+    for stage in SCAN_STAGES:
+        cumulative = 0
+        for bound, value in zip(LATENCY_BUCKETS + ('+Inf',), metrics.histograms[stage]):
+            cumulative += value
+            lines.append(f'sacred_stage_latency_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+        lines.append(f'sacred_stage_latency_seconds_sum{{stage="{stage}"}} {metrics.stage_seconds[stage]:.6f}')
+        lines.append(f'sacred_stage_latency_seconds_count{{stage="{stage}"}} {metrics.stage_counts[stage]}')
+
+    lines += ['# HELP sacred_scan_events_total Scan counters (bytes read, files skipped, ...)',
+              '# TYPE sacred_scan_events_total counter']
+    lines += [f'sacred_scan_events_total{{event="{_label(counter)}"}} {amount}'
+              for counter, amount in sorted(metrics.counters.items())]
+
+    lines += ['# HELP sacred_pattern_seconds_total Regex search time per sacred pattern',
+              '# TYPE sacred_pattern_seconds_total counter']
+    lines += [f'sacred_pattern_seconds_total{{pattern="{_label(label)}"}} {seconds:.6f}'
+              for label, seconds in sorted(metrics.pattern_seconds.items())]
+
+    for name, value in (gauges or {}).items():
+        lines += [f'# TYPE sacred_{name} gauge', f'sacred_{name} {value}']
+    return '\n'.join(lines) + '\n'
+
+
+class SacredMetricsExporter:
+    """Publishes rendered metrics to a text file and/or a local HTTP endpoint"""
+
+    def __init__(self, metrics_file=None, port=None, interval=DEFAULT_EXPORT_INTERVAL):
+        self.metrics_file = metrics_file
+        self.interval = interval
+        self.last_update = None
+        self.lock = threading.Lock()
+        self.text = ''
+        self.server = None
+        if port is not None:
+            exporter = self
+
+            class MetricsHandler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    with exporter.lock:
+                        body = exporter.text.encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    pass  # Keep scrapes out of the discovery log
+
+            self.server = ThreadingHTTPServer(('127.0.0.1', port), MetricsHandler)
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def due(self, now):
+        return self.last_update is None or now - self.last_update >= self.interval
+
+    def update(self, text, now):
+        self.last_update = now
+        with self.lock:
+            self.text = text
+        if self.metrics_file:
+            tmp_file = f"{self.metrics_file}.tmp"
+            with open(tmp_file, 'w') as f:
+                f.write(text)
+            os.replace(tmp_file, self.metrics_file)
+
+    def close(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+🚰 Sacred Scan Pipeline - Overlapped I/O and matching 🚰
+walkers -> bounded read queue -> I/O readers (prefetch) -> bounded match
+queue -> matchers, each stage with its own thread count and backpressure
+"""
+
+import os
+import time
+import queue
+import threading
+
+from archive_scanner import is_archive
+
+DEFAULT_WALK_THREADS = 2
+DEFAULT_IO_THREADS = 8
+DEFAULT_QUEUE_DEPTH = 256
+READ_BATCH = 16
+
+# Partial stats are handed to the coordinator after this many files per stage thread
+FLUSH_FILES = 2000
+
+_STAGE_DONE = object()
+
+
+class FileJob:
+    """A classified file on its way through the read and match stages"""
+    __slots__ = ('path', 'stat_result', 'category', 'risk', 'size', 'content', 'dedup_token', 'archive')
+
+    def __init__(self, path, stat_result, category, risk, size, archive=False):
+        self.path = path
+        self.stat_result = stat_result
+        self.category = category
+        self.risk = risk
+        self.size = size
+        self.content = None
+        self.dedup_token = None
+        self.archive = archive  # Archive members are scanned by a matcher; the archive itself is recorded
+
+
+def decode_text(data):
+    """Bytes to the text open(..., 'r', encoding='utf-8', errors='ignore') would yield"""
+    return data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+
+
+class SacredScanPipeline:
+    """Runs an engine's walk, read and match work as three overlapped stages"""
+
+    def __init__(self, engine, walk_threads=DEFAULT_WALK_THREADS, io_threads=DEFAULT_IO_THREADS,
+                 match_threads=4, queue_depth=DEFAULT_QUEUE_DEPTH, prefetch_bytes=None):
+        self.engine = engine
+        self.walk_threads = max(1, walk_threads)
+        self.io_threads = max(1, io_threads)
+        self.match_threads = max(1, match_threads)
+        # Files larger than this are streamed by the matcher instead of prefetched. UTF-8 decodes
+        # to at most one character per byte, so a prefetched file is never more text than a chunk
+        self.prefetch_bytes = prefetch_bytes if prefetch_bytes is not None else engine.chunk_chars
+
+        self.directory_queue = queue.Queue()
+        self.read_queue = queue.Queue(maxsize=max(1, queue_depth))
+        # Prefetched contents wait here: bounds memory to about depth x prefetch_bytes
+        self.match_queue = queue.Queue(maxsize=self.io_threads + self.match_threads)
+        self.results = queue.Queue()
+        self.stage_lock = threading.Lock()
+        self.walkers_done = threading.Event()
+        self.readers_done = threading.Event()
+
+    def run(self, directories, on_partial):
+        """Scan directories, calling on_partial(local_stats) in this thread as stage threads flush"""
+        for directory in directories:
+            self.directory_queue.put(os.fspath(directory))
+
+        stages = [(self.walk_threads, self._walker, self.walkers_done),
+                  (self.io_threads, self._reader, self.readers_done),
+                  (self.match_threads, self._matcher, None)]
+        threads = []
+        for count, target, done in stages:
+            remaining = [count]
+            for _ in range(count):
+                thread = threading.Thread(target=self._stage_thread, args=(target, remaining, done), daemon=True)
+                thread.start()
+                threads.append(thread)
+        threading.Thread(target=self._close_stages, daemon=True).start()
+
+        running = len(threads)
+        while running:
+            partial = self.results.get()
+            if partial is _STAGE_DONE:
+                running -= 1
+            else:
+                on_partial(partial)
+
+    def _close_stages(self):
+        """Shut stages down in order once the walk is exhausted"""
+        self.directory_queue.join()
+        for _ in range(self.walk_threads):
+            self.directory_queue.put(None)
+        self.walkers_done.wait()
+        for _ in range(self.io_threads):
+            self.read_queue.put(None)
+        self.readers_done.wait()
+        for _ in range(self.match_threads):
+            self.match_queue.put(None)
+
+    def _stage_thread(self, target, remaining, done):
+        """Run one stage body, then hand over its last partial stats and signal completion"""
+        try:
+            self.results.put(target(self.engine.new_local_stats()))
+        except Exception as e:
+            self.engine.log_discovery(f"❌ Sacred pipeline stage failed: {e}")
+        finally:
+            with self.stage_lock:
+                remaining[0] -= 1
+                if not remaining[0] and done is not None:
+                    done.set()
+            self.results.put(_STAGE_DONE)
+
+    def _flush(self, local_stats):
+        """Hand full partial stats to the coordinator; returns the stats to keep filling"""
+        if local_stats['files'] + local_stats['directories'] < FLUSH_FILES:
+            return local_stats
+        self.results.put(local_stats)
+        return self.engine.new_local_stats()
+
+    # Stage bodies: each returns its final partial stats
+
+    def _walker(self, local_stats):
+        engine = self.engine
+        while True:
+            directory = self.directory_queue.get()
+            if directory is None:
+                return local_stats
+            try:
+                if engine.cancel_event.is_set():
+                    continue  # Drain the queue without listing anything more
+                _, subdirectories = engine.walk_directory(
+                    directory, local_stats, lambda files: self._dispatch_files(directory, files, local_stats))
+                for subdirectory in subdirectories:
+                    self.directory_queue.put(subdirectory)
+            except Exception as e:
+                engine.log_discovery(f"⚠️ Error scanning {directory}: {e}")
+            finally:
+                self.directory_queue.task_done()
+            local_stats = self._flush(local_stats)
+
+    def _dispatch_files(self, directory, files, local_stats):
+        """Finish files needing no content scan; queue the rest for the readers"""
+        engine = self.engine
+        metrics = local_stats['metrics']
+        for path, stat_result, category, risk, size, cached in engine.prepare_file_batch(directory, files, local_stats):
+            if engine.cancel_event.is_set():
+                return
+            if cached is not None:
+                engine.record_file_result(local_stats, path, stat_result, category, risk, size, *cached)
+            elif not engine.is_content_scanned(path):
+                metrics.count('files_skipped_extension')
+                engine.record_file_result(local_stats, path, stat_result, category, risk, size, 0, [])
+                if engine.archive_scanner is not None and is_archive(path):
+                    self.read_queue.put(FileJob(path, stat_result, category, risk, size, archive=True))
+            else:
+                self.read_queue.put(FileJob(path, stat_result, category, risk, size))  # Blocks when readers lag
+
+    def _reader(self, local_stats):
+        while True:
+            job = self.read_queue.get()
+            jobs = [job]
+            # Take a batch, but never a second shutdown marker meant for another reader
+            while job is not None and len(jobs) < READ_BATCH:
+                try:
+                    job = self.read_queue.get_nowait()
+                except queue.Empty:
+                    break
+                jobs.append(job)
+
+            for job in jobs:
+                if job is None:
+                    return local_stats
+                if self.engine.cancel_event.is_set():
+                    continue
+                try:
+                    self._prefetch(job, local_stats)
+                except Exception as e:
+                    self.engine.log_discovery(f"⚠️ Error reading {job.path}: {e}")
+                    job.content = None
+                    self.match_queue.put(job)
+            local_stats = self._flush(local_stats)
+
+    def _prefetch(self, job, local_stats):
+        """Reuse a duplicate's result or read the file ahead for the matchers"""
+        engine = self.engine
+        metrics = local_stats['metrics']
+        if job.archive:
+            self.match_queue.put(job)  # Streamed member by member by the matcher
+            return
+        if engine.dedup_cache is not None:
+            result, job.dedup_token = engine.dedup_cache.lookup(job.path, job.size,
+                                                                local_stats['duplicate_groups'], metrics)
+            if result is not None:
+                engine.record_file_result(local_stats, job.path, job.stat_result, job.category,
+                                          job.risk, job.size, *result)
+                return
+        if job.size <= self.prefetch_bytes:
+            started = time.perf_counter()
+            try:
+                with open(job.path, 'rb') as f:
+                    job.content = f.read()
+                metrics.record('read', time.perf_counter() - started)
+                metrics.count('bytes_read', len(job.content))
+            except OSError:
+                job.content = None  # The matcher's streaming path records the error
+        self.match_queue.put(job)  # Blocks when matchers lag
+
+    def _matcher(self, local_stats):
+        engine = self.engine
+        while True:
+            job = self.match_queue.get()
+            if job is None:
+                return local_stats
+            if engine.cancel_event.is_set():
+                continue
+            if job.archive:
+                engine.scan_archive_members(job.path, local_stats)
+                local_stats = self._flush(local_stats)
+                continue
+            metrics = local_stats['metrics']
+            started = time.perf_counter()
+            if job.content is not None:
+                text = decode_text(job.content)
+                job.content = None
+                result = engine.rule_engine.scan(text.lower(), metrics)
+                metrics.count('files_content_scanned')
+            else:
+                result = engine.detect_sacred_content(job.path, metrics)
+            if engine.dedup_cache is not None:
+                engine.dedup_cache.store(job.dedup_token, result, local_stats['duplicate_groups'])
+            metrics.record_file(job.path, job.size, time.perf_counter() - started)
+            engine.record_file_result(local_stats, job.path, job.stat_result, job.category, job.risk,
+                                      job.size, *result)
+            local_stats = self._flush(local_stats)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+🧩 Sacred Scan Shards - Split one scan across hosts and merge the results 🧩
+Each shard walks only the subtrees it owns, so no directory below the
+shared top levels is listed or stat'ed twice; partial-results files from
+all shards merge into one final report
+"""
+
+import os
+import sys
+import json
+import zlib
+from pathlib import Path
+
+from findings_sink import SacredFinding
+from scan_metrics import SacredScanMetrics
+from scan_index import rules_fingerprint
+from archive_scanner import SacredArchiveScanner
+from scan_filters import SacredScanFilter
+from content_dedup import resolve_unhashed_files
+
+PARTIAL_VERSION = 2
+
+# Directories this many levels below the scan root are the units split between shards
+DEFAULT_SHARD_DEPTH = 2
+
+
+def parse_shard(spec):
+    """'i/N' (1-based, as CI job matrices number them) -> 0-based (index, count)"""
+    try:
+        number, count = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/N, got '{spec}'")
+    if count < 1 or not 1 <= number <= count:
+        raise ValueError(f"Shard {spec} out of range: need 1 <= i <= N")
+    return number - 1, count
+
+
+def shard_label(shard):
+    return f"{shard[0] + 1}/{shard[1]}"
+
+
+def shard_of_path(relative_path, count):
+    """Owning shard of a directory, by its path below the scan root (the same on every host)"""
+    return zlib.crc32(relative_path.encode('utf-8', errors='surrogateescape')) % count
+
+
+class SacredShardPlan:
+    """Which part of the tree one shard walks
+
+    Directories fewer than depth levels below the scan root are listed by
+    every shard, and the first shard counts them. Each directory exactly
+    depth levels down roots a subtree that only its owning shard lists,
+    stats and scans. Files in the shared levels belong to the shard that
+    owns their directory.
+    """
+
+    def __init__(self, shard, depth=DEFAULT_SHARD_DEPTH):
+        self.index, self.count = shard
+        self.depth = max(1, depth)
+        self.root = ''
+        self.root_prefix = ''
+
+    def bind(self, root):
+        """Set the scan root that shard paths are relative to"""
+        self.root = os.fspath(root)
+        self.root_prefix = os.path.join(self.root, '')
+
+    def relative(self, path):
+        if path == self.root:
+            return ''
+        if path.startswith(self.root_prefix):
+            path = path[len(self.root_prefix):]
+        return path.replace(os.sep, '/')
+
+    def owns(self, path):
+        return shard_of_path(self.relative(path), self.count) == self.index
+
+    def directory_role(self, directory):
+        """(this shard scans the directory's files, its subdirectories are split, they are shared)"""
+        relative = self.relative(directory)
+        level = relative.count('/') + 1 if relative else 0
+        owns_files = level >= self.depth or shard_of_path(relative, self.count) == self.index
+        return owns_files, level + 1 == self.depth, level + 1 < self.depth
+
+
+def default_partial_file(output_dir, shard):
+    return os.path.join(output_dir, f"sacred_partial_{shard[0] + 1}of{shard[1]}.json")
+
+
+def write_partial(engine, partial_file):
+    """Write one shard's merged stats, findings summary and metrics"""
+    sink = engine.findings_sink
+    data = {
+        'version': PARTIAL_VERSION,
+        'shard': list(engine.shard),
+        'rules_fingerprint': rules_fingerprint(engine.rule_engine),
+        'obfuscate': engine.obfuscate,
+        'thread_count': engine.thread_count,
+        'executor': engine.executor_kind,
+        'split_entries': engine.split_entries,
+        'incremental': engine.incremental,
+        'dedup': engine.dedup_cache is not None,
+        'scan_archives': engine.archive_scanner is not None,
+        'archive_depth': engine.archive_depth,
+        'archive_max_mb': engine.archive_max_mb,
+        'scan_filter': engine.scan_filter.summary() if engine.scan_filter is not None else None,
+        'shard_depth': engine.shard_plan.depth,
+        'stats': {
+            'total_files': engine.stats['total_files'],
+            'total_directories': engine.stats['total_directories'],
+            'total_size': engine.stats['total_size'],
+            'processing_time': engine.stats['processing_time'],
+            'cancelled': engine.stats['cancelled'],
+            'index_hits': engine.stats['index_hits'],
+            'pruned': engine.stats['pruned'],
+            'classifications': engine.stats['classifications'],
+            'archive_classifications': engine.stats['archive_classifications'],
+            'risk_levels': engine.stats['risk_levels']
+        },
+        'findings': {
+            'finding_count': sink.finding_count,
+            'top_findings': [finding.to_dict() for finding in sink.top_findings()],
+            'trinity_system_count': sink.trinity_system_count,
+            'trinity_system_sample': sink.trinity_system_sample
+        },
+        'duplicate_groups': engine.duplicate_groups,
+        # [size, path, digest] of files the scan itself never hashed: a copy may sit in another shard
+        'unhashed_files': engine.unhashed_files,
+        'metrics': engine.metrics.to_dict()
+    }
+    tmp_file = f"{partial_file}.tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp_file, partial_file)
+    return partial_file
+
+
+def load_partials(partial_files):
+    """Load partial-results files, checking they are one complete, consistent shard set"""
+    partials = []
+    for partial_file in partial_files:
+        with open(partial_file) as f:
+            partial = json.load(f)
+        if partial.get('version') != PARTIAL_VERSION:
+            raise ValueError(f"{partial_file}: unsupported partial-results version {partial.get('version')}")
+        partials.append(partial)
+    if not partials:
+        raise ValueError("No partial-results files to merge")
+
+    count = partials[0]['shard'][1]
+    seen = sorted(partial['shard'][0] for partial in partials)
+    if any(partial['shard'][1] != count for partial in partials):
+        raise ValueError("Partial results come from scans with different shard counts")
+    if seen != list(range(count)):
+        missing = sorted(set(range(count)) - set(seen))
+        raise ValueError(f"Shard set incomplete or repeated: have {[i + 1 for i in seen]}, "
+                         f"missing {[i + 1 for i in missing]} of {count}")
+    if len({partial['rules_fingerprint'] for partial in partials}) != 1:
+        raise ValueError("Shards were scanned with different rule sets")
+    if len({json.dumps(partial.get('scan_filter'), sort_keys=True) for partial in partials}) != 1:
+        raise ValueError("Shards were scanned with different filters")
+    if len({partial['shard_depth'] for partial in partials}) != 1:
+        raise ValueError("Shards were scanned with different --shard-depth values")
+    return partials
+
+
+def merge_partials(engine, partials):
+    """Fold shard partial results into an engine as if it had run the whole scan"""
+    engine.shard = None
+    engine.shard_count = partials[0]['shard'][1]
+    first = partials[0]
+    engine.executor_kind = first['executor']
+    engine.thread_count = first['thread_count']
+    engine.split_entries = first['split_entries']
+    engine.obfuscate = any(partial['obfuscate'] for partial in partials)
+    if not all(partial['dedup'] for partial in partials):
+        engine.dedup_cache = None
+    engine.incremental = any(partial['incremental'] for partial in partials)
+    engine.archive_depth = first['archive_depth']
+    engine.archive_max_mb = first['archive_max_mb']
+    if first['scan_archives']:
+        engine.archive_scanner = SacredArchiveScanner(engine.archive_depth, engine.archive_max_mb * 1024 * 1024)
+    scan_filter = first.get('scan_filter')
+    if scan_filter is not None:
+        engine.scan_filter = SacredScanFilter(scan_filter['patterns'], (), scan_filter['min_size'],
+                                              scan_filter['max_size'], scan_filter['include_extensions'],
+                                              scan_filter['exclude_extensions'])
+
+    for partial in partials:
+        local_stats = engine.new_local_stats()
+        stats = partial['stats']
+        local_stats.update({
+            'files': stats['total_files'],
+            'directories': stats['total_directories'],
+            'size': stats['total_size'],
+            'index_hits': stats['index_hits'],
+            'pruned': stats['pruned'],
+            'classifications': stats['classifications'],
+            'archive_classifications': stats['archive_classifications'],
+            'risk_levels': stats['risk_levels'],
+            'duplicate_groups': partial['duplicate_groups'],
+            'metrics': SacredScanMetrics.from_dict(partial['metrics'])
+        })
+        engine.merge_sacred_stats(local_stats)
+
+        findings = partial['findings']
+        engine.findings_sink.merge_summary(
+            findings['finding_count'],
+            [SacredFinding(**finding) for finding in findings['top_findings']],
+            findings['trinity_system_count'],
+            findings['trinity_system_sample'])
+
+    if engine.dedup_cache is not None:
+        # Shards hashed these files themselves: matching them reads nothing on this host
+        engine.unhashed_files, _ = resolve_unhashed_files(
+            engine.duplicate_groups, [entry for partial in partials for entry in partial['unhashed_files']])
+
+    # One cancelled shard leaves the merged report partial
+    engine.stats['cancelled'] = any(partial['stats']['cancelled'] for partial in partials)
+    
+    # Shards run side by side: the scan took as long as the slowest one
+    engine.stats['processing_time'] = max(partial['stats']['processing_time'] for partial in partials)
+    if engine.stats['processing_time'] > 0:
+        engine.stats['files_per_second'] = int(engine.stats['total_files'] / engine.stats['processing_time'])
+    return engine
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Merge sharded Sacred Trinity scans into one discovery report')
+    parser.add_argument('partials', nargs='+', help='Partial-results files written by lightning_scanner.py --shard')
+    parser.add_argument('--output', required=True, help='Output directory for the merged sacred report')
+    args = parser.parse_args()
+
+    from lightning_scanner import SacredDiscoveryEngine
+
+    try:
+        partials = load_partials(args.partials)
+    except (OSError, ValueError) as e:
+        print(f"❌ Sacred shard merge failed: {e}")
+        sys.exit(1)
+
+    os.makedirs(args.output, exist_ok=True)
+    engine = SacredDiscoveryEngine()
+    merge_partials(engine, partials)
+    engine.log_discovery(f"🧩 Merged {len(partials)} sacred shards: {engine.stats['total_files']:,} files, "
+                         f"{engine.findings_sink.finding_count} findings")
+    report_file = engine.generate_sacred_report(Path(args.output))
+    print(f"🧩 Sharded sacred discovery merged: {report_file}")
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+📈 Sacred Trend Index - Compact per-report summaries for trend dashboards 📈
+An append-only JSON Lines file with one small summary per discovery report,
+so trends over thousands of runs never re-parse the full reports
+"""
+
+import os
+import json
+from pathlib import Path
+
+TREND_INDEX_VERSION = 1
+
+DEFAULT_TREND_INDEX_NAME = 'sacred_trend_index.jsonl'
+REPORT_GLOB = 'sacred_discovery_report_*.json'
+
+
+def summarize_report(data, report_file):
+    """Trend summary of one parsed discovery report (older reports lack some fields)"""
+    audit = data['sacred_trinity_discovery_report']
+    metadata = audit.get('metadata', {})
+    metrics = audit.get('performance_metrics', {})
+    findings = audit.get('sacred_trinity_findings', {})
+    return {
+        'report': report_file,
+        'timestamp': metadata.get('discovery_timestamp', ''),
+        'executor': metadata.get('executor', 'thread'),
+        'threads': metadata.get('thread_count'),
+        'shards': metadata.get('shards', 1),
+        'files': metrics.get('total_files_discovered', 0),
+        'directories': metrics.get('total_sacred_chambers', 0),
+        'size_mb': metrics.get('total_size_mb', 0),
+        'seconds': metrics.get('discovery_time_seconds', 0),
+        'files_per_second': metrics.get('files_per_second', 0),
+        'findings': findings.get('total_sacred_items', 0),
+        'trinity_systems': findings.get('sacred_trinity_systems', 0),
+        'classifications': audit.get('content_classification', {}),
+        'risk_levels': audit.get('risk_assessment', {})
+    }
+
+
+class SacredTrendIndex:
+    """Append-only report summaries: adding a report is one line written"""
+
+    def __init__(self, index_file):
+        self.index_file = os.fspath(index_file)
+
+    def load(self):
+        """Summaries in index order; a stale or missing index yields none"""
+        summaries = []
+        try:
+            with open(self.index_file) as f:
+                header = f.readline()
+                if not header or json.loads(header).get('trend_index_version') != TREND_INDEX_VERSION:
+                    return []
+                for line in f:
+                    try:
+                        summaries.append(json.loads(line))
+                    except ValueError:
+                        continue  # Torn line from an interrupted append
+        except (OSError, ValueError):
+            return []
+        return summaries
+
+    def append(self, summaries):
+        """Append summaries, starting a fresh index if none (or a stale one) exists"""
+        fresh = not self._current()
+        with open(self.index_file, 'w' if fresh else 'a') as f:
+            if fresh:
+                f.write(json.dumps({'trend_index_version': TREND_INDEX_VERSION}) + '\n')
+            for summary in summaries:
+                f.write(json.dumps(summary, separators=(',', ':')) + '\n')
+
+    def add_report(self, report_file):
+        """Summarize one report and append it without reading the rest of the index"""
+        report_file = os.path.abspath(report_file)
+        with open(report_file) as f:
+            summary = summarize_report(json.load(f), report_file)
+        self.append([summary])
+        return summary
+
+    def sync_directory(self, report_dir):
+        """Append every report in report_dir not yet indexed; returns how many were added"""
+        known = {summary['report'] for summary in self.load()}
+        summaries = []
+        for report_file in sorted(Path(report_dir).glob(REPORT_GLOB)):
+            report_file = os.path.abspath(report_file)
+            if report_file in known:
+                continue
+            try:
+                with open(report_file) as f:
+                    summaries.append(summarize_report(json.load(f), report_file))
+            except (OSError, ValueError, KeyError):
+                continue  # Unreadable or not a discovery report
+        if summaries:
+            self.append(summaries)
+        return len(summaries)
+
+    def _current(self):
+        try:
+            with open(self.index_file) as f:
+                return json.loads(f.readline()).get('trend_index_version') == TREND_INDEX_VERSION
+        except (OSError, ValueError):
+            return False